@@ -1,14 +1,35 @@
 """Reachy Mini Pomodoro - A productivity timer app with expressive robot companionship."""
 
+import importlib
+
 __version__ = "0.1.0"
 
+# Public name -> (module, attribute), imported on first access so that
+# lightweight modules don't drag in main (and the robot SDK).
+_LAZY = {
+    "ReachyMiniPomodoro": ("reachy_mini_pomodoro.main", "ReachyMiniPomodoro"),
+    "PomodoroDatabase": ("reachy_mini_pomodoro.database", "PomodoroDatabase"),
+    "PomodoroSettings": ("reachy_mini_pomodoro.config", "PomodoroSettings"),
+    "CompitaSettings": ("reachy_mini_pomodoro.config", "CompitaSettings"),
+    "DEFAULT_BREAK_ACTIVITIES": ("reachy_mini_pomodoro.config", "DEFAULT_BREAK_ACTIVITIES"),
+}
+
 
 def __getattr__(name: str):
-    """Lazy import for ReachyMiniPomodoro to avoid import errors when dependencies missing."""
-    if name == "ReachyMiniPomodoro":
-        from reachy_mini_pomodoro.main import ReachyMiniPomodoro
-        return ReachyMiniPomodoro
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    """Lazy import public names to avoid import errors when dependencies missing."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
 
 
-__all__ = ["ReachyMiniPomodoro"]
+__all__ = [
+    "ReachyMiniPomodoro",
+    "PomodoroDatabase",
+    "PomodoroSettings",
+    "CompitaSettings",
+    "DEFAULT_BREAK_ACTIVITIES",
+]
@@ -2,8 +2,6 @@
 
 import argparse
 
-from reachy_mini_pomodoro.main import ReachyMiniPomodoro
-
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Reachy Mini Pomodoro App")
@@ -19,6 +17,9 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    # Imported after argument parsing so --help doesn't pay for the robot SDK
+    from reachy_mini_pomodoro.main import ReachyMiniPomodoro
+
     media_backend = "no_media" if args.no_robot_audio else None
 
     app = ReachyMiniPomodoro(
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import Final, Optional, Tuple
 
 
 class TimerState(Enum):
@@ -14,7 +14,7 @@ class TimerState(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+@dataclass(slots=True)
 class PomodoroSettings:
     """Configurable Pomodoro timer settings."""
 
@@ -32,7 +32,7 @@ class PomodoroSettings:
     enable_movements: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BreakActivity:
     """A suggested activity during breaks."""
     name: str
@@ -42,7 +42,7 @@ class BreakActivity:
 
 
 # Default break activities
-DEFAULT_BREAK_ACTIVITIES: List[BreakActivity] = [
+DEFAULT_BREAK_ACTIVITIES: Tuple[BreakActivity, ...] = (
     BreakActivity(
         name="Deep Breathing",
         description="Take 5 deep breaths. Inhale for 4 seconds, hold for 4, exhale for 4.",
@@ -91,16 +91,37 @@ DEFAULT_BREAK_ACTIVITIES: List[BreakActivity] = [
         duration_seconds=30,
         robot_demo=True
     ),
-]
+)
 
 
 # App configuration
-APP_HOST = "0.0.0.0"
-APP_PORT = 8042
-CUSTOM_APP_URL = f"http://{APP_HOST}:{APP_PORT}"
+APP_HOST: Final[str] = "0.0.0.0"
+APP_PORT: Final[int] = 8042
+CUSTOM_APP_URL: Final[str] = f"http://{APP_HOST}:{APP_PORT}"
 
 # Update frequency for the main control loop (Hz)
-CONTROL_LOOP_FREQUENCY = 50  
+CONTROL_LOOP_FREQUENCY: Final[int] = 50
+# Seconds per control loop tick, precomputed so the loop doesn't divide each iteration
+CONTROL_LOOP_PERIOD: Final[float] = 1.0 / CONTROL_LOOP_FREQUENCY
+
+# The timer only needs to resolve seconds, so it ticks slower than motion (Hz)
+TIMER_UPDATE_FREQUENCY: Final[int] = 10
+TIMER_UPDATE_PERIOD: Final[float] = 1.0 / TIMER_UPDATE_FREQUENCY
+
+# Minimum seconds between repeated "Error setting robot target" warnings
+SET_TARGET_WARNING_INTERVAL: Final[float] = 5.0
+# Upper bound in seconds on the retry backoff after consecutive set_target failures
+SET_TARGET_MAX_BACKOFF: Final[float] = 1.0
+# Seconds shutdown waits for an in-flight set_target call before giving up on it
+SET_TARGET_JOIN_TIMEOUT: Final[float] = 2.0
+
+# Poses are compared at 1/TARGET_QUANTIZATION resolution before re-sending them
+TARGET_QUANTIZATION: Final[float] = 1e4
+
+# How often the status WebSocket re-checks for changes: every second while a
+# session counts down, rarely otherwise (changes are also pushed on events)
+STATUS_STREAM_ACTIVE_INTERVAL: Final[float] = 1.0
+STATUS_STREAM_IDLE_INTERVAL: Final[float] = 5.0
 
 
 DEFAULT_COMPITA_INSTRUCTIONS = """You are Compita, a friendly and encouraging productivity assistant for the Reachy Mini Pomodoro app.
@@ -126,7 +147,7 @@ Always use the available tools to get accurate information rather than guessing.
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class CompitaSettings:
     """Configuration for Compita voice assistant.
 
@@ -1,11 +1,15 @@
 """SQLite database for Pomodoro app persistence and history."""
 
+import atexit
 import logging
 import sqlite3
-from dataclasses import dataclass
-from datetime import date, datetime
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Final, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +26,68 @@ TAG_COLORS = [
     "#00bcd4",  # Cyan
 ]
 
-
-@dataclass
+_INSERT_TASK_SQL: Final[str] = """
+    INSERT INTO tasks
+    (id, title, estimated_pomodoros, completed_pomodoros, status, priority, due_date, tags, created_at, completed_at, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title,
+        estimated_pomodoros = excluded.estimated_pomodoros,
+        completed_pomodoros = excluded.completed_pomodoros,
+        status = excluded.status,
+        priority = excluded.priority,
+        due_date = excluded.due_date,
+        tags = excluded.tags,
+        completed_at = excluded.completed_at,
+        notes = excluded.notes
+"""
+
+_INSERT_SESSION_SQL: Final[str] = """
+    INSERT INTO pomodoro_sessions
+    (task_id, task_title, started_at, completed_at, duration_seconds, session_type, tags)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_DAILY_SQL: Final[str] = """
+    INSERT INTO daily_stats (date, total_pomodoros, total_focus_minutes, tasks_completed)
+    VALUES (?, ?, ?, 0)
+    ON CONFLICT(date) DO UPDATE SET
+        total_pomodoros = total_pomodoros + excluded.total_pomodoros,
+        total_focus_minutes = total_focus_minutes + excluded.total_focus_minutes
+"""
+
+_TASK_COLUMNS: Final[str] = (
+    "id, title, estimated_pomodoros, completed_pomodoros, status, priority, "
+    "due_date, tags, created_at, completed_at, notes"
+)
+
+_SESSION_COLUMNS: Final[str] = (
+    "id, task_id, task_title, started_at, completed_at, duration_seconds, "
+    "session_type, tags"
+)
+
+_DAILY_STATS_COLUMNS: Final[str] = (
+    "date, total_pomodoros, total_focus_minutes, tasks_completed"
+)
+
+# Bumped whenever _init_db gains a migration; stored in PRAGMA user_version
+_SCHEMA_VERSION: Final[int] = 1
+
+# Statements cached per connection by the sqlite3 module
+_STATEMENT_CACHE_SIZE: Final[int] = 256
+
+
+def _split_tags(tags: str) -> List[str]:
+    """Split a comma-separated tag string into normalized tag names."""
+    return [t.strip().lower() for t in tags.split(",") if t.strip()]
+
+
+def _parse_tags_list(tags: str) -> Tuple[str, ...]:
+    """Split a comma-separated tag string for display, interning each tag."""
+    return tuple(sys.intern(t.strip()) for t in tags.split(",") if t.strip())
+
+
+@dataclass(frozen=True, slots=True)
 class PomodoroSession:
     """A completed pomodoro session."""
 
@@ -35,9 +99,13 @@ class PomodoroSession:
     duration_seconds: int
     session_type: str
     tags: str
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        return {
+        """Serialize for JSON. Built once per record; do not mutate the result."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        result = {
             "id": self.id,
             "task_id": self.task_id,
             "task_title": self.task_title,
@@ -47,9 +115,11 @@ class PomodoroSession:
             "session_type": self.session_type,
             "tags": self.tags,
         }
+        object.__setattr__(self, "_dict_cache", result)
+        return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskRecord:
     """A task record in the database."""
 
@@ -64,9 +134,18 @@ class TaskRecord:
     created_at: datetime
     completed_at: Optional[datetime]
     notes: str
+    tags_list: Optional[Tuple[str, ...]] = field(default=None, repr=False, compare=False)
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.tags_list is None:
+            object.__setattr__(self, "tags_list", _parse_tags_list(self.tags))
 
     def to_dict(self) -> dict:
-        return {
+        """Serialize for JSON. Built once per record; do not mutate the result."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        result = {
             "id": self.id,
             "title": self.title,
             "estimated_pomodoros": self.estimated_pomodoros,
@@ -75,11 +154,48 @@ class TaskRecord:
             "priority": self.priority,
             "due_date": self.due_date.isoformat() if self.due_date else None,
             "tags": self.tags,
-            "tags_list": [t.strip() for t in self.tags.split(",") if t.strip()],
+            "tags_list": list(self.tags_list),
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "notes": self.notes,
         }
+        object.__setattr__(self, "_dict_cache", result)
+        return result
+
+
+def _to_epoch(value: Optional[datetime]) -> Optional[int]:
+    """Convert a naive local datetime to integer unix seconds for storage."""
+    return int(value.timestamp()) if value else None
+
+
+def _task_row(task: TaskRecord) -> tuple:
+    """Parameters for _INSERT_TASK_SQL."""
+    return (
+        task.id,
+        task.title,
+        task.estimated_pomodoros,
+        task.completed_pomodoros,
+        task.status,
+        task.priority,
+        task.due_date.isoformat() if task.due_date else None,
+        task.tags,
+        _to_epoch(task.created_at),
+        _to_epoch(task.completed_at),
+        task.notes,
+    )
+
+
+def _session_row(session: PomodoroSession) -> tuple:
+    """Parameters for _INSERT_SESSION_SQL."""
+    return (
+        session.task_id,
+        session.task_title,
+        _to_epoch(session.started_at),
+        _to_epoch(session.completed_at),
+        session.duration_seconds,
+        session.session_type,
+        session.tags,
+    )
 
 
 class PomodoroDatabase:
@@ -88,15 +204,92 @@ class PomodoroDatabase:
     def __init__(self, db_path: Optional[Path] = None) -> None:
         self.db_path = db_path or DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        self._conn.set_trace_callback(None)
+        self._conn.row_factory = sqlite3.Row
+        # (name, color) pairs sorted by name. Replaced wholesale under self._lock
+        # whenever tags change and read without any lock, so get_all_tags never
+        # waits behind database writes
+        self._tags: Tuple[Tuple[str, str], ...] = ()
         self._init_db()
+        with self._lock:
+            self._reload_tags()
+        # Separate read-only connection so lookups never queue behind writes.
+        # When both locks are needed, take self._lock first
+        self._read_lock = threading.Lock()
+        self._read_conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        self._read_conn.execute("PRAGMA query_only=1")
+        atexit.register(self.close)
 
     def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Return the shared connection. Callers must hold ``self._lock``."""
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Database connection is closed")
+        return self._conn
+
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        """Cursor yielding plain tuples. Callers must hold ``self._lock``."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        return cursor
+
+    def _get_read_cursor(self) -> sqlite3.Cursor:
+        """Tuple cursor on the read-only connection. Callers must hold ``self._read_lock``."""
+        if self._read_conn is None:
+            raise sqlite3.ProgrammingError("Database connection is closed")
+        return self._read_conn.cursor()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run the enclosed statements in a single BEGIN/COMMIT.
+
+        Nested use joins the outer transaction.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            if conn.in_transaction:
+                yield cursor
+                return
+            cursor.execute("BEGIN")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
+    def close(self) -> None:
+        """Optimize and close the shared connections."""
+        # Write lock, then read lock: the order used wherever both are held
+        with self._lock:
+            with self._read_lock:
+                if self._read_conn is not None:
+                    self._read_conn.close()
+                    self._read_conn = None
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.debug("PRAGMA optimize failed: %s", e)
+            self._conn.close()
+            self._conn = None
 
     def _migrate_db(self, cursor: sqlite3.Cursor) -> None:
-        """Add new columns if they don't exist (for existing databases)."""
+        """Add new columns if they don't exist (for databases before schema version 1)."""
         cursor.execute("PRAGMA table_info(tasks)")
         columns = {row[1] for row in cursor.fetchall()}
 
@@ -108,309 +301,366 @@ class PomodoroDatabase:
             cursor.execute("ALTER TABLE tasks ADD COLUMN due_date DATE")
             logger.info("Added 'due_date' column to tasks table")
 
-    def _init_db(self) -> None:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                estimated_pomodoros INTEGER DEFAULT 1,
-                completed_pomodoros INTEGER DEFAULT 0,
-                status TEXT DEFAULT 'pending',
-                priority TEXT DEFAULT 'medium',
-                due_date DATE,
-                tags TEXT DEFAULT '',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP,
-                notes TEXT DEFAULT ''
+    def _migrate_timestamps(self, cursor: sqlite3.Cursor) -> None:
+        """Convert legacy ISO-8601 text timestamps to integer unix seconds.
+
+        Old rows were written as naive local time, hence the 'utc' modifier.
+        """
+        for table, column in (
+            ("tasks", "created_at"),
+            ("tasks", "completed_at"),
+            ("pomodoro_sessions", "started_at"),
+            ("pomodoro_sessions", "completed_at"),
+        ):
+            cursor.execute(
+                f"UPDATE {table} SET {column} = CAST(strftime('%s', {column}, 'utc') AS INTEGER) "
+                f"WHERE typeof({column}) = 'text'"
             )
-        """)
-
-        self._migrate_db(cursor)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS pomodoro_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task_id TEXT,
-                task_title TEXT,
-                started_at TIMESTAMP NOT NULL,
-                completed_at TIMESTAMP NOT NULL,
-                duration_seconds INTEGER NOT NULL,
-                session_type TEXT NOT NULL,
-                tags TEXT DEFAULT '',
-                FOREIGN KEY (task_id) REFERENCES tasks(id)
+            if cursor.rowcount > 0:
+                logger.info(
+                    "Converted %d %s.%s values to epoch seconds", cursor.rowcount, table, column
+                )
+
+    def _backfill_task_tags(self, cursor: sqlite3.Cursor) -> None:
+        """Populate task_tags from the legacy tasks.tags column."""
+        cursor.execute("SELECT id, tags FROM tasks WHERE tags != ''")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO task_tags (task_id, tag_name) VALUES (?, ?)",
+            [
+                (row["id"], tag)
+                for row in cursor.fetchall()
+                for tag in _split_tags(row["tags"] or "")
+            ],
+        )
+
+    def _init_db(self) -> None:
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-20000")
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    estimated_pomodoros INTEGER DEFAULT 1,
+                    completed_pomodoros INTEGER DEFAULT 0,
+                    status TEXT DEFAULT 'pending',
+                    priority TEXT DEFAULT 'medium',
+                    due_date DATE,
+                    tags TEXT DEFAULT '',
+                    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                    completed_at INTEGER,
+                    notes TEXT DEFAULT ''
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS pomodoro_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id TEXT,
+                    task_title TEXT,
+                    started_at INTEGER NOT NULL,
+                    completed_at INTEGER NOT NULL,
+                    duration_seconds INTEGER NOT NULL,
+                    session_type TEXT NOT NULL,
+                    tags TEXT DEFAULT '',
+                    FOREIGN KEY (task_id) REFERENCES tasks(id)
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS daily_stats (
+                    date TEXT PRIMARY KEY,
+                    total_pomodoros INTEGER DEFAULT 0,
+                    total_focus_minutes INTEGER DEFAULT 0,
+                    tasks_completed INTEGER DEFAULT 0
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tags (
+                    name TEXT PRIMARY KEY,
+                    color TEXT DEFAULT '#3498db',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS task_tags (
+                    task_id TEXT NOT NULL,
+                    tag_name TEXT NOT NULL,
+                    PRIMARY KEY (task_id, tag_name)
+                )
+            """)
+
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] < _SCHEMA_VERSION:
+                self._migrate_db(cursor)
+                self._migrate_timestamps(cursor)
+                self._backfill_task_tags(cursor)
+                cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_completed_at "
+                "ON pomodoro_sessions(completed_at)"
             )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS daily_stats (
-                date TEXT PRIMARY KEY,
-                total_pomodoros INTEGER DEFAULT 0,
-                total_focus_minutes INTEGER DEFAULT 0,
-                tasks_completed INTEGER DEFAULT 0
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_task_completed "
+                "ON pomodoro_sessions(task_id, completed_at)"
             )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_status_created "
+                "ON tasks(status, created_at)"
             )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tags (
-                name TEXT PRIMARY KEY,
-                color TEXT DEFAULT '#3498db',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags(tag_name)"
             )
-        """)
-
-        conn.commit()
-        conn.close()
 
     def save_task(self, task: TaskRecord) -> None:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO tasks
-            (id, title, estimated_pomodoros, completed_pomodoros, status, priority, due_date, tags, created_at, completed_at, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                task.id,
-                task.title,
-                task.estimated_pomodoros,
-                task.completed_pomodoros,
-                task.status,
-                task.priority,
-                task.due_date.isoformat() if task.due_date else None,
-                task.tags,
-                task.created_at,
-                task.completed_at,
-                task.notes,
-            ),
+        with self._transaction() as cursor:
+            cursor.execute(_INSERT_TASK_SQL, _task_row(task))
+            self._save_task_tags(cursor, [task])
+
+    def save_tasks(self, tasks: List[TaskRecord]) -> None:
+        """Save many tasks in a single transaction."""
+        if not tasks:
+            return
+        with self._transaction() as cursor:
+            cursor.executemany(_INSERT_TASK_SQL, [_task_row(task) for task in tasks])
+            self._save_task_tags(cursor, tasks)
+
+    def _save_task_tags(self, cursor: sqlite3.Cursor, tasks: List[TaskRecord]) -> None:
+        """Replace the task_tags rows for the given tasks."""
+        cursor.executemany(
+            "DELETE FROM task_tags WHERE task_id = ?", [(task.id,) for task in tasks]
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO task_tags (task_id, tag_name) VALUES (?, ?)",
+            [(task.id, tag) for task in tasks for tag in _split_tags(task.tags)],
         )
-        conn.commit()
-        conn.close()
 
     def get_task(self, task_id: str) -> Optional[TaskRecord]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,))
+            row = cursor.fetchone()
         if row:
             return self._row_to_task(row)
         return None
 
     def get_all_tasks(self, include_completed: bool = True) -> List[TaskRecord]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        if include_completed:
-            cursor.execute("SELECT * FROM tasks ORDER BY created_at DESC")
-        else:
-            cursor.execute(
-                "SELECT * FROM tasks WHERE status != 'completed' ORDER BY created_at DESC"
-            )
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            if include_completed:
+                cursor.execute(f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY created_at DESC")
+            else:
+                cursor.execute(
+                    f"SELECT {_TASK_COLUMNS} FROM tasks "
+                    "WHERE status != 'completed' ORDER BY created_at DESC"
+                )
+            rows = cursor.fetchall()
         return [self._row_to_task(row) for row in rows]
 
     def get_tasks_by_tag(self, tag: str) -> List[TaskRecord]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM tasks WHERE tags LIKE ? ORDER BY created_at DESC",
-            (f"%{tag}%",),
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                f"""
+                SELECT {_TASK_COLUMNS} FROM tasks
+                JOIN task_tags tt ON tt.task_id = tasks.id
+                WHERE tt.tag_name = ?
+                ORDER BY tasks.created_at DESC
+                """,
+                (tag.lower().strip(),),
+            )
+            rows = cursor.fetchall()
         return [self._row_to_task(row) for row in rows]
 
     def get_tasks_by_status(self, status: str) -> List[TaskRecord]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM tasks WHERE status = ? ORDER BY created_at DESC", (status,)
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                f"SELECT {_TASK_COLUMNS} FROM tasks WHERE status = ? ORDER BY created_at DESC",
+                (status,),
+            )
+            rows = cursor.fetchall()
         return [self._row_to_task(row) for row in rows]
 
     def delete_task(self, task_id: str) -> bool:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return deleted
-
-    def _row_to_task(self, row: sqlite3.Row) -> TaskRecord:
-        due_date = None
-        if row["due_date"]:
-            due_date = date.fromisoformat(row["due_date"])
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
+            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            return cursor.rowcount > 0
+
+    def _row_to_task(self, row: tuple) -> TaskRecord:
+        """Build a TaskRecord from a row selected with _TASK_COLUMNS."""
+        (id_, title, estimated, completed, status, priority,
+         due, tags, created, completed_at, notes) = row
+        tags = tags or ""
         return TaskRecord(
-            id=row["id"],
-            title=row["title"],
-            estimated_pomodoros=row["estimated_pomodoros"],
-            completed_pomodoros=row["completed_pomodoros"],
-            status=row["status"],
-            priority=row["priority"] or "medium",
-            due_date=due_date,
-            tags=row["tags"] or "",
-            created_at=(
-                datetime.fromisoformat(row["created_at"])
-                if row["created_at"]
-                else datetime.now()
-            ),
-            completed_at=(
-                datetime.fromisoformat(row["completed_at"])
-                if row["completed_at"]
-                else None
-            ),
-            notes=row["notes"] or "",
+            id=id_,
+            title=title,
+            estimated_pomodoros=estimated,
+            completed_pomodoros=completed,
+            status=status,
+            priority=priority or "medium",
+            due_date=date.fromisoformat(due) if due else None,
+            tags=tags,
+            created_at=datetime.fromtimestamp(created) if created else datetime.now(),
+            completed_at=datetime.fromtimestamp(completed_at) if completed_at else None,
+            notes=notes or "",
+            tags_list=_parse_tags_list(tags),
         )
 
-    def save_pomodoro_session(self, session: PomodoroSession) -> int:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO pomodoro_sessions
-            (task_id, task_title, started_at, completed_at, duration_seconds, session_type, tags)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                session.task_id,
-                session.task_title,
-                session.started_at,
-                session.completed_at,
-                session.duration_seconds,
-                session.session_type,
-                session.tags,
-            ),
-        )
+    def save_pomodoro_session(
+        self, session: PomodoroSession, cursor: Optional[sqlite3.Cursor] = None
+    ) -> int:
+        """Save a session and update daily stats in the same transaction.
+
+        Pass ``cursor`` to join a transaction the caller already holds.
+        """
+        if cursor is None:
+            with self._transaction() as cursor:
+                return self.save_pomodoro_session(session, cursor)
+
+        cursor.execute(_INSERT_SESSION_SQL, _session_row(session))
         session_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        self._update_daily_stats(session)
+        if session.session_type == "focus":
+            day = session.completed_at.date().isoformat()
+            self._update_daily_stats_bulk(
+                cursor, {day: (1, session.duration_seconds // 60)}
+            )
         return session_id
 
+    def save_pomodoro_sessions(self, sessions: List[PomodoroSession]) -> None:
+        """Save many sessions in a single transaction.
+
+        Daily stats are aggregated per date and updated once per date
+        rather than once per session.
+        """
+        if not sessions:
+            return
+        by_date: Dict[str, Tuple[int, int]] = {}
+        for session in sessions:
+            if session.session_type == "focus":
+                day = session.completed_at.date().isoformat()
+                count, minutes = by_date.get(day, (0, 0))
+                by_date[day] = (count + 1, minutes + session.duration_seconds // 60)
+
+        with self._transaction() as cursor:
+            cursor.executemany(
+                _INSERT_SESSION_SQL, [_session_row(session) for session in sessions]
+            )
+            self._update_daily_stats_bulk(cursor, by_date)
+
     def get_sessions_by_date(self, target_date: date) -> List[PomodoroSession]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM pomodoro_sessions
-            WHERE date(completed_at) = ?
-            ORDER BY completed_at DESC
-            """,
-            (target_date.isoformat(),),
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        # Range predicate instead of date(completed_at) so the index is used
+        day_start = datetime.combine(target_date, time.min)
+        day_end = day_start + timedelta(days=1)
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                f"""
+                SELECT {_SESSION_COLUMNS} FROM pomodoro_sessions
+                WHERE completed_at >= ? AND completed_at < ?
+                ORDER BY completed_at DESC
+                """,
+                (_to_epoch(day_start), _to_epoch(day_end)),
+            )
+            rows = cursor.fetchall()
         return [self._row_to_session(row) for row in rows]
 
     def get_sessions_by_task(self, task_id: str) -> List[PomodoroSession]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM pomodoro_sessions
-            WHERE task_id = ?
-            ORDER BY completed_at DESC
-            """,
-            (task_id,),
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                f"""
+                SELECT {_SESSION_COLUMNS} FROM pomodoro_sessions
+                WHERE task_id = ?
+                ORDER BY completed_at DESC
+                """,
+                (task_id,),
+            )
+            rows = cursor.fetchall()
         return [self._row_to_session(row) for row in rows]
 
     def get_recent_sessions(self, limit: int = 50) -> List[PomodoroSession]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM pomodoro_sessions
-            ORDER BY completed_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                f"""
+                SELECT {_SESSION_COLUMNS} FROM pomodoro_sessions
+                ORDER BY completed_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            rows = cursor.fetchall()
         return [self._row_to_session(row) for row in rows]
 
-    def _row_to_session(self, row: sqlite3.Row) -> PomodoroSession:
+    def _row_to_session(self, row: tuple) -> PomodoroSession:
+        """Build a PomodoroSession from a row selected with _SESSION_COLUMNS."""
+        (id_, task_id, task_title, started_at, completed_at,
+         duration_seconds, session_type, tags) = row
         return PomodoroSession(
-            id=row["id"],
-            task_id=row["task_id"],
-            task_title=row["task_title"],
-            started_at=datetime.fromisoformat(row["started_at"]),
-            completed_at=datetime.fromisoformat(row["completed_at"]),
-            duration_seconds=row["duration_seconds"],
-            session_type=row["session_type"],
-            tags=row["tags"] or "",
+            id=id_,
+            task_id=task_id,
+            task_title=task_title,
+            started_at=datetime.fromtimestamp(started_at),
+            completed_at=datetime.fromtimestamp(completed_at),
+            duration_seconds=duration_seconds,
+            session_type=session_type,
+            tags=tags or "",
         )
 
-    def _update_daily_stats(self, session: PomodoroSession) -> None:
-        if session.session_type != "focus":
+    def _update_daily_stats_bulk(
+        self, cursor: sqlite3.Cursor, by_date: Dict[str, Tuple[int, int]]
+    ) -> None:
+        """Add (pomodoros, focus_minutes) per date to daily_stats in one executemany."""
+        if not by_date:
             return
-
-        today = session.completed_at.date().isoformat()
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO daily_stats (date, total_pomodoros, total_focus_minutes, tasks_completed)
-            VALUES (?, 1, ?, 0)
-            ON CONFLICT(date) DO UPDATE SET
-                total_pomodoros = total_pomodoros + 1,
-                total_focus_minutes = total_focus_minutes + ?
-            """,
-            (today, session.duration_seconds // 60, session.duration_seconds // 60),
+        cursor.executemany(
+            _UPSERT_DAILY_SQL,
+            [(day, count, minutes) for day, (count, minutes) in by_date.items()],
         )
 
-        conn.commit()
-        conn.close()
-
     def increment_tasks_completed(self, target_date: Optional[date] = None) -> None:
         target = (target_date or date.today()).isoformat()
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO daily_stats (date, total_pomodoros, total_focus_minutes, tasks_completed)
-            VALUES (?, 0, 0, 1)
-            ON CONFLICT(date) DO UPDATE SET
-                tasks_completed = tasks_completed + 1
-            """,
-            (target,),
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._get_connection().cursor()
+            cursor.execute(
+                """
+                INSERT INTO daily_stats (date, total_pomodoros, total_focus_minutes, tasks_completed)
+                VALUES (?, 0, 0, 1)
+                ON CONFLICT(date) DO UPDATE SET
+                    tasks_completed = tasks_completed + 1
+                """,
+                (target,),
+            )
 
     def get_daily_stats(self, target_date: Optional[date] = None) -> dict:
         target = (target_date or date.today()).isoformat()
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM daily_stats WHERE date = ?", (target,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                f"SELECT {_DAILY_STATS_COLUMNS} FROM daily_stats WHERE date = ?", (target,)
+            )
+            row = cursor.fetchone()
 
         if row:
-            return {
-                "date": row["date"],
-                "total_pomodoros": row["total_pomodoros"],
-                "total_focus_minutes": row["total_focus_minutes"],
-                "tasks_completed": row["tasks_completed"],
-            }
+            return self._row_to_daily_stats(row)
         return {
             "date": target,
             "total_pomodoros": 0,
@@ -419,124 +669,119 @@ class PomodoroDatabase:
         }
 
     def get_stats_range(self, start_date: date, end_date: date) -> List[dict]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM daily_stats
-            WHERE date >= ? AND date <= ?
-            ORDER BY date DESC
-            """,
-            (start_date.isoformat(), end_date.isoformat()),
-        )
-        rows = cursor.fetchall()
-        conn.close()
-        return [
-            {
-                "date": row["date"],
-                "total_pomodoros": row["total_pomodoros"],
-                "total_focus_minutes": row["total_focus_minutes"],
-                "tasks_completed": row["tasks_completed"],
-            }
-            for row in rows
-        ]
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                f"""
+                SELECT {_DAILY_STATS_COLUMNS} FROM daily_stats
+                WHERE date >= ? AND date <= ?
+                ORDER BY date DESC
+                """,
+                (start_date.isoformat(), end_date.isoformat()),
+            )
+            rows = cursor.fetchall()
+        return [self._row_to_daily_stats(row) for row in rows]
+
+    def _row_to_daily_stats(self, row: tuple) -> dict:
+        """Build a stats dict from a row selected with _DAILY_STATS_COLUMNS."""
+        day, total_pomodoros, total_focus_minutes, tasks_completed = row
+        return {
+            "date": day,
+            "total_pomodoros": total_pomodoros,
+            "total_focus_minutes": total_focus_minutes,
+            "tasks_completed": tasks_completed,
+        }
 
     def save_tag(self, name: str, color: Optional[str] = None) -> dict:
         name = name.lower().strip()
-        if not color:
-            existing_count = len(self.get_all_tags())
-            color = TAG_COLORS[existing_count % len(TAG_COLORS)]
-
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT color FROM tags WHERE name = ?", (name,))
-        existing = cursor.fetchone()
-        if existing:
-            conn.close()
-            return {"name": name, "color": existing["color"]}
-
-        cursor.execute(
-            "INSERT INTO tags (name, color) VALUES (?, ?)",
-            (name, color),
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._tuple_cursor()
+            cursor.execute("SELECT color FROM tags WHERE name = ?", (name,))
+            existing = cursor.fetchone()
+            if existing:
+                return {"name": name, "color": existing[0]}
+
+            if not color:
+                existing_count = cursor.execute("SELECT COUNT(*) FROM tags").fetchone()[0]
+                color = TAG_COLORS[existing_count % len(TAG_COLORS)]
+
+            cursor.execute(
+                "INSERT INTO tags (name, color) VALUES (?, ?)",
+                (name, color),
+            )
+            self._reload_tags()
         return {"name": name, "color": color}
 
+    def _reload_tags(self) -> None:
+        """Publish a fresh tag snapshot. Callers must hold ``self._lock``."""
+        cursor = self._tuple_cursor()
+        cursor.execute("SELECT name, color FROM tags ORDER BY name")
+        self._tags = tuple(cursor.fetchall())
+
     def get_all_tags(self) -> List[dict]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tags ORDER BY name")
-        rows = cursor.fetchall()
-        conn.close()
-        return [{"name": row["name"], "color": row["color"]} for row in rows]
+        """All tags, from the in-memory snapshot (no lock, no query)."""
+        return [{"name": name, "color": color} for name, color in self._tags]
 
     def delete_tag(self, name: str) -> bool:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tags WHERE name = ?", (name.lower().strip(),))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return deleted
+        with self._lock:
+            cursor = self._get_connection().cursor()
+            cursor.execute("DELETE FROM tags WHERE name = ?", (name.lower().strip(),))
+            deleted = cursor.rowcount > 0
+            self._reload_tags()
+            return deleted
 
     def save_setting(self, key: str, value: str) -> None:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO settings (key, value)
-            VALUES (?, ?)
-            """,
-            (key, value),
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._get_connection().cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO settings (key, value)
+                VALUES (?, ?)
+                """,
+                (key, value),
+            )
 
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
+            row = cursor.fetchone()
         if row:
-            return row["value"]
+            return row[0]
         return default
 
     def get_history_summary(self, days: int = 7) -> dict:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                COUNT(*) as total_sessions,
-                SUM(CASE WHEN session_type = 'focus' THEN 1 ELSE 0 END) as focus_sessions,
-                SUM(CASE WHEN session_type = 'focus' THEN duration_seconds ELSE 0 END) as total_focus_seconds
-            FROM pomodoro_sessions
-            WHERE completed_at >= date('now', ?)
-            """,
-            (f"-{days} days",),
-        )
-        totals = cursor.fetchone()
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) as completed_tasks
-            FROM tasks
-            WHERE status = 'completed'
-            AND completed_at >= date('now', ?)
-            """,
-            (f"-{days} days",),
-        )
-        tasks = cursor.fetchone()
-
-        conn.close()
+        since = f"-{days} days"
+        with self._read_lock:
+            cursor = self._get_read_cursor()
+            cursor.execute(
+                """
+                WITH cutoff AS (
+                    SELECT CAST(strftime('%s', 'now', 'localtime', 'start of day', ?, 'utc') AS INTEGER) AS ts
+                )
+                SELECT
+                    COUNT(*) as total_sessions,
+                    SUM(CASE WHEN session_type = 'focus' THEN 1 ELSE 0 END) as focus_sessions,
+                    SUM(CASE WHEN session_type = 'focus' THEN duration_seconds ELSE 0 END) as total_focus_seconds,
+                    (
+                        SELECT COUNT(*)
+                        FROM tasks
+                        WHERE status = 'completed'
+                        AND completed_at >= (SELECT ts FROM cutoff)
+                    ) as completed_tasks
+                FROM pomodoro_sessions
+                WHERE completed_at >= (SELECT ts FROM cutoff)
+                """,
+                (since,),
+            )
+            total_sessions, focus_sessions, total_focus_seconds, completed_tasks = (
+                cursor.fetchone()
+            )
 
         return {
             "days": days,
-            "total_sessions": totals["total_sessions"] or 0,
-            "focus_sessions": totals["focus_sessions"] or 0,
-            "total_focus_minutes": (totals["total_focus_seconds"] or 0) // 60,
-            "completed_tasks": tasks["completed_tasks"] or 0,
+            "total_sessions": total_sessions or 0,
+            "focus_sessions": focus_sessions or 0,
+            "total_focus_minutes": (total_focus_seconds or 0) // 60,
+            "completed_tasks": completed_tasks or 0,
         }
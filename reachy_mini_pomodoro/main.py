@@ -2,21 +2,36 @@
 
 import asyncio
 import logging
+import os
+import queue
+import selectors
+import socket
 import threading
 import time
 import traceback
-from typing import List, Optional
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Final, List, Optional, Tuple, TypeVar
 from urllib.parse import urlparse
 
+import numpy as np
+import orjson
 import uvicorn
 from fastapi import WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 from reachy_mini import ReachyMini, ReachyMiniApp
 
 from reachy_mini_pomodoro.config import (
-    CONTROL_LOOP_FREQUENCY,
+    CONTROL_LOOP_PERIOD,
     CUSTOM_APP_URL,
     DEFAULT_COMPITA_SETTINGS,
+    SET_TARGET_JOIN_TIMEOUT,
+    SET_TARGET_MAX_BACKOFF,
+    SET_TARGET_WARNING_INTERVAL,
+    STATUS_STREAM_ACTIVE_INTERVAL,
+    STATUS_STREAM_IDLE_INTERVAL,
+    TARGET_QUANTIZATION,
+    TIMER_UPDATE_PERIOD,
     TimerState,
     CompitaSettings,
 )
@@ -24,10 +39,94 @@ from reachy_mini_pomodoro.movements import MovementManager, MovementType
 from reachy_mini_pomodoro.pomodoro_timer import PomodoroTimer, TimerEvent
 from reachy_mini_pomodoro.task_manager import TaskManager
 
+# Voice support is optional; resolve it once here rather than on every call
+try:
+    from reachy_mini_pomodoro.voice.agent import (
+        CompitaVoiceAgent,
+        CompitaVoiceSession,
+        SessionState,
+    )
+    _VOICE_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
+    CompitaVoiceAgent = CompitaVoiceSession = SessionState = None
+    _VOICE_IMPORT_ERROR = e
+
+try:
+    from reachy_mini_pomodoro.voice.robot_voice import RobotVoiceLoop
+    _ROBOT_VOICE_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
+    RobotVoiceLoop = None
+    _ROBOT_VOICE_IMPORT_ERROR = e
+
+try:
+    from reachy_mini.media.media_manager import MediaBackend
+    _MEDIA_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
+    MediaBackend = None
+    _MEDIA_IMPORT_ERROR = e
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# libuv-backed event loop for the settings server when available
+try:
+    import uvloop  # noqa: F401
+
+    _UVICORN_LOOP = "uvloop"
+except ImportError:
+    _UVICORN_LOOP = "asyncio"
+
+# C HTTP parser for the settings server when available, pure-Python h11 otherwise
+try:
+    import httptools  # noqa: F401
+
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "h11"
+
+
+def _json_text(obj: object) -> str:
+    """Encode a payload with orjson, several times faster than the json module."""
+    return orjson.dumps(obj).decode()
+
+
+# Audio frames buffered for a browser voice client before the oldest is dropped
+_MAX_QUEUED_AUDIO_FRAMES: Final = 64
+
+# Timer states whose countdown changes the status payload every second
+_COUNTDOWN_STATES: Final = frozenset(
+    {TimerState.FOCUS, TimerState.SHORT_BREAK, TimerState.LONG_BREAK}
+)
+
+
+def _mask_api_key(api_key: Optional[str]) -> str:
+    """Mask an API key for display, keeping only its prefix and last 4 chars."""
+    if not api_key:
+        return ""
+    if len(api_key) > 8:
+        return api_key[:7] + "..." + api_key[-4:]
+    return "••••••••"
+
 
-class AddTaskRequest(BaseModel):
+# Timer event -> (movement, duration, queued movement, queued duration, queued loop)
+_EVENT_MOVEMENTS: Final[Dict[str, Tuple[MovementType, float, Optional[MovementType], float, bool]]] = {
+    "focus_started": (MovementType.FOCUS_START, 2.0, MovementType.BREATHING, 60.0, True),
+    "focus_reminder": (MovementType.FOCUS_REMINDER, 1.5, MovementType.BREATHING, 60.0, True),
+    "focus_completed": (MovementType.FOCUS_COMPLETE, 2.0, None, 0.0, False),
+    "break_started": (MovementType.BREAK_START, 2.0, MovementType.BREATHING_DEMO, 12.0, True),
+    "break_completed": (MovementType.NOD_YES, 1.0, MovementType.IDLE, 1.0, False),
+    "timer_paused": (MovementType.IDLE, 1.0, None, 0.0, False),
+    "timer_stopped": (MovementType.IDLE, 1.0, None, 0.0, False),
+}
+
+
+class _RequestModel(BaseModel):
+    """Base for API request bodies: read-only once validated, unknown keys dropped."""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
+
+class AddTaskRequest(_RequestModel):
     title: str
     estimated_pomodoros: int = 1
     notes: str = ""
@@ -36,7 +135,7 @@ class AddTaskRequest(BaseModel):
     due_date: Optional[str] = None
 
 
-class UpdateTaskRequest(BaseModel):
+class UpdateTaskRequest(_RequestModel):
     title: Optional[str] = None
     estimated_pomodoros: Optional[int] = None
     notes: Optional[str] = None
@@ -45,24 +144,38 @@ class UpdateTaskRequest(BaseModel):
     due_date: Optional[str] = None
 
 
-class ReorderTasksRequest(BaseModel):
+class ReorderTasksRequest(_RequestModel):
+    model_config = ConfigDict(extra="forbid")
+
     task_ids: List[str]
 
 
-class UpdateSettingsRequest(BaseModel):
+class UpdateSettingsRequest(_RequestModel):
     focus_duration: Optional[int] = None
     short_break_duration: Optional[int] = None
     long_break_duration: Optional[int] = None
     pomodoros_until_long_break: Optional[int] = None
 
 
-class UpdateCompitaSettingsRequest(BaseModel):
+class UpdateCompitaSettingsRequest(_RequestModel):
     enabled: Optional[bool] = None
     openai_api_key: Optional[str] = None
     voice: Optional[str] = None
     system_instructions: Optional[str] = None
 
 
+# Resolve the request schemas at import time instead of on the first request
+for _model in (
+    AddTaskRequest,
+    UpdateTaskRequest,
+    ReorderTasksRequest,
+    UpdateSettingsRequest,
+    UpdateCompitaSettingsRequest,
+):
+    _model.model_rebuild()
+del _model
+
+
 class ReachyMiniPomodoro(ReachyMiniApp):
     """Pomodoro productivity timer app with Reachy Mini robot companion.
 
@@ -80,67 +193,102 @@ class ReachyMiniPomodoro(ReachyMiniApp):
         self.localhost_only = localhost_only
         self._media_backend_override = media_backend_override
         self.logger = logging.getLogger("reachy_mini.pomodoro")
-        self.task_manager = TaskManager()
+        # Database writes are flushed by _call_locked after the state lock is released
+        self.task_manager = TaskManager(defer_writes=True)
         self.timer = PomodoroTimer()
         self.movement_manager = MovementManager()
+        # Serializes in-memory timer/task mutations between the control loop, API
+        # handlers and voice tools. Never held across disk I/O, and never taken
+        # on the event loop thread (handlers go through asyncio.to_thread)
+        self._state_lock = threading.RLock()
+        # Pose buffers the control loop hands to movement_manager.update()
+        self._head_buf = np.empty((4, 4))
+        self._antennas_buf = np.empty(2)
+        # Latest target published by the control loop for the writer thread
+        self._target_lock = threading.Lock()
+        self._target_ready = threading.Event()
+        self._target_head = np.empty((4, 4))
+        self._target_antennas = np.empty(2)
+        self._target_body_yaw = 0.0
+        # Socket pair the control loop selects on, so API handlers and stop()
+        # can wake it before its next tick (sockets are selectable on Windows too)
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._wake_sel = selectors.DefaultSelector()
+        self._wake_sel.register(self._wake_r, selectors.EVENT_READ)
+        # Timer events are handled on their own thread so movement and database
+        # work triggered by a transition never lands on a control loop tick
+        self._event_queue: "queue.SimpleQueue[Optional[TimerEvent]]" = queue.SimpleQueue()
         self.timer.add_event_listener(self._handle_timer_event)
+        # (event loop, asyncio.Event) per connected status WebSocket
+        self._status_subscribers: set = set()
+        self._status_subscribers_lock = threading.Lock()
+        self.timer.add_event_listener(self._notify_status_changed)
         self._sound_enabled = True
         self._compita_settings = compita_settings or DEFAULT_COMPITA_SETTINGS
+        # Read once; the dashboard polls status and settings every second
+        self._env_api_key = os.getenv("OPENAI_API_KEY")
+        self._masked_api_key = _mask_api_key(self._compita_settings.openai_api_key)
         self._compita = None
         self._active_voice_session = None  # Track active voice session for notifications
         self._reachy_mini = None  # Store robot reference for audio
         self._robot_voice_loop = None  # Robot microphone voice loop
 
     def _handle_timer_event(self, event: TimerEvent) -> None:
-        self.logger.info(f"Timer event: {event.event_type} - {event.data}")
+        self._event_queue.put(event)
+
+    def _event_worker_loop(self) -> None:
+        """Dispatch queued timer events until a None sentinel arrives."""
+        while True:
+            event = self._event_queue.get()
+            if event is None:
+                return
+            try:
+                self._dispatch_timer_event(event)
+            except Exception as e:
+                self.logger.error("Error handling timer event %s: %s", event.event_type, e)
 
-        if event.event_type == "focus_started":
-            self.movement_manager.start_movement(MovementType.FOCUS_START, duration=2.0)
+    def _dispatch_timer_event(self, event: TimerEvent) -> None:
+        self.logger.info("Timer event: %s - %s", event.event_type, event.data)
+        entry = self._EVENT_DISPATCH.get(event.event_type)
+        if entry is None:
+            return
+        plan, handler = entry
+        if plan is not None:
+            movement, duration, queued, queued_duration, queued_loop = plan
+            self.movement_manager.start_movement_fast(movement, duration)
+            if queued is not None:
+                self.movement_manager.queue_movement_fast(queued, queued_duration, queued_loop)
+        if handler is not None:
+            handler(self, event)
+
+    def _on_focus_completed(self, event: TimerEvent) -> None:
+        with self._state_lock:
+            task = self.task_manager.complete_pomodoro()
+        self.task_manager.flush_writes()
+        # The timer's own notify fired before the pomodoro was recorded here
+        self._notify_status_changed()
+        if task and task.completed_pomodoros >= task.estimated_pomodoros:
             self.movement_manager.queue_movement(
-                MovementType.BREATHING, duration=60.0, loop=True
+                MovementType.TASK_COMPLETE, duration=2.0
             )
 
-        elif event.event_type == "focus_reminder":
+    def _on_timer_resumed(self, event: TimerEvent) -> None:
+        # Use the state carried by the event: the timer may have moved on since
+        if event.data.get("state") == TimerState.FOCUS.value:
             self.movement_manager.start_movement(
-                MovementType.FOCUS_REMINDER, duration=1.5
-            )
-            self.movement_manager.queue_movement(
                 MovementType.BREATHING, duration=60.0, loop=True
             )
 
-        elif event.event_type == "focus_completed":
-            self.movement_manager.start_movement(
-                MovementType.FOCUS_COMPLETE, duration=2.0
-            )
-            task = self.task_manager.complete_pomodoro()
-            if task and task.completed_pomodoros >= task.estimated_pomodoros:
-                self.movement_manager.queue_movement(
-                    MovementType.TASK_COMPLETE, duration=2.0
-                )
-
-        elif event.event_type == "break_started":
-            self.movement_manager.start_movement(
-                MovementType.BREAK_START, duration=2.0
-            )
-            self.movement_manager.queue_movement(
-                MovementType.BREATHING_DEMO, duration=12.0, loop=True
-            )
-
-        elif event.event_type == "break_completed":
-            self.movement_manager.start_movement(MovementType.NOD_YES, duration=1.0)
-            self.movement_manager.queue_movement(MovementType.IDLE, duration=1.0)
-
-        elif event.event_type == "timer_paused":
-            self.movement_manager.start_movement(MovementType.IDLE, duration=1.0)
-
-        elif event.event_type == "timer_resumed":
-            if self.timer.state == TimerState.FOCUS:
-                self.movement_manager.start_movement(
-                    MovementType.BREATHING, duration=60.0, loop=True
-                )
-
-        elif event.event_type == "timer_stopped":
-            self.movement_manager.start_movement(MovementType.IDLE, duration=1.0)
+    # Event type -> (movement plan, extra handler), resolved with one lookup.
+    # Handlers are stored as plain functions and called with the app, so
+    # dispatch doesn't create a bound method per event.
+    _EVENT_DISPATCH: Dict[str, Tuple[Optional[tuple], Optional[Callable[..., None]]]] = {
+        event_type: (plan, None) for event_type, plan in _EVENT_MOVEMENTS.items()
+    }
+    _EVENT_DISPATCH["focus_completed"] = (_EVENT_MOVEMENTS["focus_completed"], _on_focus_completed)
+    _EVENT_DISPATCH["timer_resumed"] = (None, _on_timer_resumed)
 
     def _start_compita(self) -> None:
         """Initialize and start Compita voice assistant."""
@@ -149,7 +297,8 @@ class ReachyMiniPomodoro(ReachyMiniApp):
             return
 
         try:
-            from reachy_mini_pomodoro.voice.agent import CompitaVoiceAgent
+            if CompitaVoiceAgent is None:
+                raise _VOICE_IMPORT_ERROR
 
             self._compita = CompitaVoiceAgent(
                 timer=self.timer,
@@ -158,17 +307,18 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 openai_api_key=self._compita_settings.openai_api_key,
                 model=self._compita_settings.model,
                 voice=self._compita_settings.voice,
+                state_call=self._call_locked,
             )
             self._compita.start()
             self.logger.info("Compita voice assistant started")
 
         except ImportError as e:
-            self.logger.warning(f"Compita dependencies not installed: {e}")
+            self.logger.warning("Compita dependencies not installed: %s", e)
             self.logger.info("Install with: pip install openai")
         except ValueError as e:
-            self.logger.warning(f"Compita not configured: {e}")
+            self.logger.warning("Compita not configured: %s", e)
         except Exception as e:
-            self.logger.error(f"Failed to start Compita: {e}")
+            self.logger.error("Failed to start Compita: %s", e)
 
     def _stop_compita(self) -> None:
         """Stop Compita voice assistant."""
@@ -177,7 +327,7 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 self._compita.stop()
                 self.logger.info("Compita stopped")
             except Exception as e:
-                self.logger.error(f"Error stopping Compita: {e}")
+                self.logger.error("Error stopping Compita: %s", e)
             self._compita = None
 
     def _start_robot_voice_loop(self) -> bool:
@@ -207,17 +357,19 @@ class ReachyMiniPomodoro(ReachyMiniApp):
 
             # Check if media backend is available
             try:
-                from reachy_mini.media.media_manager import MediaBackend
+                if MediaBackend is None:
+                    raise _MEDIA_IMPORT_ERROR
                 backend = self._reachy_mini.media.backend
                 if backend == MediaBackend.NO_MEDIA:
                     self.logger.info("No media backend - using browser audio only")
                     return False
-                self.logger.info(f"Media backend available: {backend}")
+                self.logger.info("Media backend available: %s", backend)
             except Exception as e:
-                self.logger.warning(f"Could not check media backend: {e}")
+                self.logger.warning("Could not check media backend: %s", e)
                 return False
 
-            from reachy_mini_pomodoro.voice.robot_voice import RobotVoiceLoop
+            if RobotVoiceLoop is None:
+                raise _ROBOT_VOICE_IMPORT_ERROR
 
             self._robot_voice_loop = RobotVoiceLoop(
                 robot=self._reachy_mini,
@@ -226,16 +378,17 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 movement_manager=self.movement_manager,
                 openai_api_key=self._compita_settings.openai_api_key,
                 voice=self._compita_settings.voice,
+                state_call=self._call_locked,
             )
             self._robot_voice_loop.start()
             self.logger.info("Robot voice loop started (using robot microphone)")
             return True
 
         except ImportError as e:
-            self.logger.info(f"Robot voice dependencies not available: {e}")
+            self.logger.info("Robot voice dependencies not available: %s", e)
             return False
         except Exception as e:
-            self.logger.warning(f"Could not start robot voice loop: {e}")
+            self.logger.warning("Could not start robot voice loop: %s", e)
             return False
 
     def _stop_robot_voice_loop(self) -> None:
@@ -245,9 +398,143 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 self._robot_voice_loop.stop()
                 self.logger.info("Robot voice loop stopped")
             except Exception as e:
-                self.logger.error(f"Error stopping robot voice loop: {e}")
+                self.logger.error("Error stopping robot voice loop: %s", e)
             self._robot_voice_loop = None
 
+    def _timer_response(self, success: bool) -> dict:
+        """Build a timer endpoint response around a single get_status() call."""
+        self._wake_control_loop()
+        return {"success": success, "status": self.timer.get_status()}
+
+    def _start_focus(self) -> bool:
+        """Select the first pending task if none is current, then start focus."""
+        if not self.task_manager.get_current_task():
+            pending = self.task_manager.get_pending_tasks()
+            if pending:
+                self.task_manager.set_current_task(pending[0].id)
+        return self.timer.start_focus()
+
+    def _status_payload(self) -> dict:
+        return {
+            "timer": self.timer.get_status(),
+            "tasks": self.task_manager.to_dict(),
+        }
+
+    def _notify_status_changed(self, event: Optional[TimerEvent] = None) -> None:
+        """Wake every status WebSocket so it pushes the new state (thread-safe)."""
+        with self._status_subscribers_lock:
+            subscribers = tuple(self._status_subscribers)
+        for loop, changed in subscribers:
+            try:
+                loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:
+                pass  # Loop already closed; the handler is going away
+
+    def _wake_control_loop(self) -> None:
+        """Make the control loop run its next tick now instead of at the deadline."""
+        try:
+            self._wake_w.send(b"x")
+        except OSError:
+            # Buffer full: the loop already has a wake-up pending
+            pass
+
+    def _wait_for_wake(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds; return True if woken early."""
+        if not self._wake_sel.select(timeout):
+            return False
+        try:
+            while self._wake_r.recv(64):
+                pass
+        except OSError:
+            pass
+        return True
+
+    def _close_wake_socket(self) -> None:
+        """Release the wake socket pair and its selector once the loop has exited.
+
+        A late _wake_control_loop() then hits the closed socket's OSError and
+        is ignored.
+        """
+        self._wake_sel.unregister(self._wake_r)
+        self._wake_sel.close()
+        self._wake_r.close()
+        self._wake_w.close()
+
+    def stop(self) -> None:
+        super().stop()
+        self._wake_control_loop()
+
+    def _call_locked(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Call func while holding the state lock, then persist and push status.
+
+        Blocks, so call it from a worker thread (asyncio.to_thread in handlers).
+        """
+        try:
+            with self._state_lock:
+                result = func(*args, **kwargs)
+        finally:
+            # Outside the lock, so the control loop never waits on sqlite
+            self.task_manager.flush_writes()
+        self._notify_status_changed()
+        return result
+
+    def _publish_target(self, head_pose: np.ndarray, antennas: np.ndarray,
+                        body_yaw: float) -> None:
+        """Hand the latest pose to the target writer, replacing any unsent one."""
+        with self._target_lock:
+            np.copyto(self._target_head, head_pose)
+            np.copyto(self._target_antennas, antennas)
+            self._target_body_yaw = body_yaw
+        self._target_ready.set()
+
+    def _target_writer_loop(self, reachy_mini: ReachyMini, stop_event: threading.Event) -> None:
+        """Send published poses to the robot so its IO never stalls the control loop."""
+        head_pose = np.empty((4, 4))
+        antennas = np.empty(2)
+        set_target = reachy_mini.set_target
+        target_ready = self._target_ready
+        target_lock = self._target_lock
+        last_warning = -SET_TARGET_WARNING_INTERVAL
+        suppressed = 0
+        failures = 0
+        while not stop_event.is_set():
+            if not target_ready.wait(timeout=0.1):
+                continue
+            with target_lock:
+                target_ready.clear()
+                np.copyto(head_pose, self._target_head)
+                np.copyto(antennas, self._target_antennas)
+                body_yaw = self._target_body_yaw
+            try:
+                set_target(
+                    head=head_pose,
+                    antennas=antennas,
+                    body_yaw=body_yaw,
+                )
+            except Exception as e:
+                failures += 1
+                # A disconnected robot fails every tick; warn at most once per interval
+                now = time.monotonic()
+                if now - last_warning >= SET_TARGET_WARNING_INTERVAL:
+                    if self.logger.isEnabledFor(logging.WARNING):
+                        self.logger.warning(
+                            "Error setting robot target: %s (%d similar errors suppressed)",
+                            e, suppressed,
+                        )
+                    last_warning = now
+                    suppressed = 0
+                else:
+                    suppressed += 1
+                # Back off exponentially instead of retrying a failing transport on
+                # every published pose. Re-arm the slot so the newest pose is retried
+                # afterwards even if the control loop has nothing new to publish
+                target_ready.set()
+                backoff = min(CONTROL_LOOP_PERIOD * 2 ** min(failures, 16), SET_TARGET_MAX_BACKOFF)
+                if stop_event.wait(backoff):
+                    break
+            else:
+                failures = 0
+
     def run(self, reachy_mini: ReachyMini, stop_event: threading.Event) -> None:
         self.logger.info("Starting Reachy Mini Pomodoro app...")
         self._reachy_mini = reachy_mini  # Store robot reference for audio
@@ -258,87 +545,203 @@ class ReachyMiniPomodoro(ReachyMiniApp):
         if not robot_voice_started:
             self._start_compita()
 
-        loop_period = 1.0 / CONTROL_LOOP_FREQUENCY
-
+        period_ns = int(CONTROL_LOOP_PERIOD * 1e9)
+        timer_period_ns = int(TIMER_UPDATE_PERIOD * 1e9)
+        now_ns = time.perf_counter_ns()
+        next_deadline = now_ns
+        next_timer_deadline = now_ns
+        last_target = None
+        target_writer = threading.Thread(
+            target=self._target_writer_loop,
+            args=(reachy_mini, stop_event),
+            name="pomodoro-set-target",
+            daemon=True,
+        )
+        target_writer.start()
+        event_worker = threading.Thread(
+            target=self._event_worker_loop,
+            name="pomodoro-timer-events",
+            daemon=True,
+        )
+        event_worker.start()
+
+        # Bound once so the hot loop does local loads instead of attribute lookups
+        clock = time.perf_counter_ns
+        is_stopped = stop_event.is_set
+        state_lock = self._state_lock
+        timer_update = self.timer.update
+        mm_update = self.movement_manager.update
+        head_buf = self._head_buf
+        antennas_buf = self._antennas_buf
+        head_key = np.empty((3, 4))
+        antennas_key = np.empty(2)
+        publish_target = self._publish_target
+        wait_for_wake = self._wait_for_wake
+        log_debug = self.logger.debug
+        debug_enabled = self.logger.isEnabledFor
         try:
-            while not stop_event.is_set():
-                loop_start = time.time()
-                self.timer.update()
-                head_pose, antennas, body_yaw = self.movement_manager.update()
-
-                try:
-                    reachy_mini.set_target(
-                        head=head_pose,
-                        antennas=antennas,
-                        body_yaw=body_yaw,
-                    )
-                except Exception as e:
-                    self.logger.warning(f"Error setting robot target: {e}")
+            while not is_stopped():
+                if now_ns >= next_timer_deadline:
+                    with state_lock:
+                        timer_update()
+                    next_timer_deadline = max(next_timer_deadline + timer_period_ns, now_ns)
+
+                head_pose, antennas, body_yaw = mm_update(
+                    out_head=head_buf, out_antennas=antennas_buf
+                )
 
-                elapsed = time.time() - loop_start
-                sleep_time = loop_period - elapsed
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Skip the robot call when the pose hasn't changed since the last send,
+                # comparing on a 1e-4 grid so float jitter doesn't count as motion.
+                # The head's bottom row is always [0, 0, 0, 1], so only 3x4 is compared
+                np.rint(np.multiply(head_pose[:3], TARGET_QUANTIZATION, out=head_key), out=head_key)
+                np.rint(np.multiply(antennas, TARGET_QUANTIZATION, out=antennas_key), out=antennas_key)
+                target = (
+                    head_key.tobytes(),
+                    antennas_key.tobytes(),
+                    round(body_yaw * TARGET_QUANTIZATION),
+                )
+                if target != last_target:
+                    publish_target(head_pose, antennas, body_yaw)
+                    last_target = target
+
+                # Sleep to an absolute deadline so the loop phase doesn't drift
+                # One clock read per tick: after sleeping, "now" is the deadline
+                next_deadline += period_ns
+                now_ns = clock()
+                sleep_ns = next_deadline - now_ns
+                if sleep_ns > 0:
+                    # API handlers and stop() can cut the sleep short
+                    if wait_for_wake(sleep_ns / 1e9):
+                        if is_stopped():
+                            break
+                        # Run an extra tick now, keeping the deadline for the
+                        # regular one so the loop stays phase-locked
+                        now_ns = clock()
+                        next_deadline -= period_ns
+                    else:
+                        now_ns = next_deadline
+                else:
+                    # No sleep this tick: still yield the GIL so the server and
+                    # voice threads aren't starved while the loop catches up
+                    time.sleep(0)
+                    if debug_enabled(logging.DEBUG):
+                        log_debug("Control loop overran by %.1f ms", -sleep_ns / 1e6)
+                    if -sleep_ns > period_ns:
+                        # Too far behind: resync instead of bursting to catch up
+                        next_deadline = now_ns
 
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt, stopping...")
         finally:
+            stop_event.set()
+            # set_target can block on a stalled robot connection; don't hang on it
+            target_writer.join(timeout=SET_TARGET_JOIN_TIMEOUT)
+            if target_writer.is_alive():
+                self.logger.warning(
+                    "Target writer still blocked in set_target after %.1f s; not waiting for it",
+                    SET_TARGET_JOIN_TIMEOUT,
+                )
+            self._event_queue.put(None)
+            event_worker.join()
             self._stop_robot_voice_loop()
             self._stop_compita()
+            self._close_wake_socket()
             self.logger.info("Pomodoro app stopped.")
 
     def _setup_api_endpoints(self) -> None:
         if self.settings_app is None:
             return
 
-        @self.settings_app.get("/api/status")
-        def get_status():
-            return {
-                "timer": self.timer.get_status(),
-                "tasks": self.task_manager.to_dict(),
-            }
+        # Picked up by every route registered below
+        self.settings_app.router.default_response_class = ORJSONResponse
+
+        # Handlers are async so they skip the threadpool hop; state mutations take
+        # the state lock and write to sqlite, so they go through asyncio.to_thread
+        # and _call_locked and can't stall the event loop.
+        @self.settings_app.get("/api/status", response_model=None)
+        async def get_status():
+            return self._status_payload()
+
+        @self.settings_app.websocket("/api/status/ws")
+        async def status_stream(websocket: WebSocket):
+            """Push /api/status payloads when they change, replacing client polling."""
+            await websocket.accept()
+            loop = asyncio.get_running_loop()
+            changed = asyncio.Event()
+            subscriber = (loop, changed)
+            with self._status_subscribers_lock:
+                self._status_subscribers.add(subscriber)
+            # Clients never send anything; receiving only detects disconnects
+            receiver = asyncio.create_task(websocket.receive())
+            last_sent = None
+            try:
+                while True:
+                    if receiver.done():
+                        if receiver.result()["type"] == "websocket.disconnect":
+                            break
+                        receiver = asyncio.create_task(websocket.receive())
+
+                    changed.clear()
+                    payload = _json_text(self._status_payload())
+                    if payload != last_sent:
+                        await websocket.send_text(payload)
+                        last_sent = payload
+
+                    # Changes are pushed via `changed`; the timeout covers the
+                    # per-second countdown and updates made outside the API
+                    if self.timer.state in _COUNTDOWN_STATES:
+                        timeout = STATUS_STREAM_ACTIVE_INTERVAL
+                    else:
+                        timeout = STATUS_STREAM_IDLE_INTERVAL
+                    waiter = asyncio.create_task(changed.wait())
+                    await asyncio.wait(
+                        {receiver, waiter},
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    waiter.cancel()
+            except (WebSocketDisconnect, RuntimeError):
+                pass
+            finally:
+                with self._status_subscribers_lock:
+                    self._status_subscribers.discard(subscriber)
+                receiver.cancel()
+
+        @self.settings_app.post("/api/timer/start", response_model=None)
+        async def start_timer():
+            success = await asyncio.to_thread(self._call_locked, self._start_focus)
+            return self._timer_response(success)
+
+        def make_timer_action(action: Callable[[], bool]) -> Callable[[], Awaitable[dict]]:
+            async def timer_action():
+                success = await asyncio.to_thread(self._call_locked, action)
+                return self._timer_response(success)
+            return timer_action
+
+        # The remaining timer controls only differ by which timer method they call
+        for path, action in (
+            ("pause", self.timer.pause),
+            ("resume", self.timer.resume),
+            ("stop", self.timer.stop),
+            ("skip", self.timer.skip),
+            ("break", self.timer.start_break),
+        ):
+            self.settings_app.add_api_route(
+                f"/api/timer/{path}",
+                make_timer_action(action),
+                methods=["POST"],
+                response_model=None,
+            )
 
-        @self.settings_app.post("/api/timer/start")
-        def start_timer():
-            if not self.task_manager.get_current_task():
-                pending = self.task_manager.get_pending_tasks()
-                if pending:
-                    self.task_manager.set_current_task(pending[0].id)
-            success = self.timer.start_focus()
-            return {"success": success, "status": self.timer.get_status()}
-
-        @self.settings_app.post("/api/timer/pause")
-        def pause_timer():
-            success = self.timer.pause()
-            return {"success": success, "status": self.timer.get_status()}
-
-        @self.settings_app.post("/api/timer/resume")
-        def resume_timer():
-            success = self.timer.resume()
-            return {"success": success, "status": self.timer.get_status()}
-
-        @self.settings_app.post("/api/timer/stop")
-        def stop_timer():
-            success = self.timer.stop()
-            return {"success": success, "status": self.timer.get_status()}
-
-        @self.settings_app.post("/api/timer/skip")
-        def skip_timer():
-            success = self.timer.skip()
-            return {"success": success, "status": self.timer.get_status()}
-
-        @self.settings_app.post("/api/timer/break")
-        def start_break():
-            success = self.timer.start_break()
-            return {"success": success, "status": self.timer.get_status()}
-
-        @self.settings_app.get("/api/tasks")
-        def get_tasks():
+        @self.settings_app.get("/api/tasks", response_model=None)
+        async def get_tasks():
             return self.task_manager.to_dict()
 
-        @self.settings_app.post("/api/tasks")
-        def add_task(request: AddTaskRequest):
-            task = self.task_manager.add_task(
+        @self.settings_app.post("/api/tasks", response_model=None)
+        async def add_task(request: AddTaskRequest):
+            task = await asyncio.to_thread(
+                self._call_locked,
+                self.task_manager.add_task,
                 title=request.title,
                 estimated_pomodoros=request.estimated_pomodoros,
                 notes=request.notes,
@@ -347,11 +750,14 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 due_date=request.due_date,
             )
             self.movement_manager.start_movement(MovementType.NOD_YES, duration=1.0)
+            self._wake_control_loop()
             return {"success": True, "task": task.to_dict()}
 
-        @self.settings_app.put("/api/tasks/{task_id}")
-        def update_task(task_id: str, request: UpdateTaskRequest):
-            task = self.task_manager.update_task(
+        @self.settings_app.put("/api/tasks/{task_id}", response_model=None)
+        async def update_task(task_id: str, request: UpdateTaskRequest):
+            task = await asyncio.to_thread(
+                self._call_locked,
+                self.task_manager.update_task,
                 task_id=task_id,
                 title=request.title,
                 estimated_pomodoros=request.estimated_pomodoros,
@@ -364,29 +770,37 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 return {"success": True, "task": task.to_dict()}
             return {"success": False, "error": "Task not found"}
 
-        @self.settings_app.delete("/api/tasks/{task_id}")
-        def delete_task(task_id: str):
-            success = self.task_manager.delete_task(task_id)
+        @self.settings_app.delete("/api/tasks/{task_id}", response_model=None)
+        async def delete_task(task_id: str):
+            success = await asyncio.to_thread(
+                self._call_locked, self.task_manager.delete_task, task_id
+            )
             if success:
                 self.movement_manager.start_movement(MovementType.NOD_NO, duration=0.8)
+                self._wake_control_loop()
             return {"success": success}
 
-        @self.settings_app.post("/api/tasks/{task_id}/select")
-        def select_task(task_id: str):
-            task = self.task_manager.set_current_task(task_id)
+        @self.settings_app.post("/api/tasks/{task_id}/select", response_model=None)
+        async def select_task(task_id: str):
+            task = await asyncio.to_thread(
+                self._call_locked, self.task_manager.set_current_task, task_id
+            )
             if task:
                 return {"success": True, "task": task.to_dict()}
             return {"success": False, "error": "Task not found or already completed"}
 
-        @self.settings_app.post("/api/tasks/{task_id}/complete")
+        @self.settings_app.post("/api/tasks/{task_id}/complete", response_model=None)
         async def complete_task(task_id: str):
-            self.logger.info(f"Complete task endpoint called for task_id: {task_id}")
-            task = self.task_manager.complete_task(task_id)
+            self.logger.info("Complete task endpoint called for task_id: %s", task_id)
+            task = await asyncio.to_thread(
+                self._call_locked, self.task_manager.complete_task, task_id
+            )
             if task:
-                self.logger.info(f"Task found, starting CELEBRATION movement")
+                self.logger.info("Task found, starting CELEBRATION movement")
                 self.movement_manager.start_movement(
                     MovementType.CELEBRATION, duration=3.0
                 )
+                self._wake_control_loop()
                 # Notify voice session about task completion
                 if self._active_voice_session:
                     try:
@@ -395,57 +809,61 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                             "Congratulate them briefly and enthusiastically!"
                         )
                     except Exception as e:
-                        self.logger.debug(f"Could not notify voice session: {e}")
+                        self.logger.debug("Could not notify voice session: %s", e)
                 return {"success": True, "task": task.to_dict()}
-            self.logger.warning(f"Task not found for task_id: {task_id}")
+            self.logger.warning("Task not found for task_id: %s", task_id)
             return {"success": False, "error": "Task not found"}
 
-        @self.settings_app.post("/api/tasks/reorder")
-        def reorder_tasks(request: ReorderTasksRequest):
-            success = self.task_manager.reorder_tasks(request.task_ids)
+        @self.settings_app.post("/api/tasks/reorder", response_model=None)
+        async def reorder_tasks(request: ReorderTasksRequest):
+            success = await asyncio.to_thread(
+                self._call_locked, self.task_manager.reorder_tasks, request.task_ids
+            )
             return {"success": success}
 
-        @self.settings_app.post("/api/tasks/clear-completed")
-        def clear_completed():
-            count = self.task_manager.clear_completed()
+        @self.settings_app.post("/api/tasks/clear-completed", response_model=None)
+        async def clear_completed():
+            count = await asyncio.to_thread(self._call_locked, self.task_manager.clear_completed)
             return {"success": True, "removed_count": count}
 
-        @self.settings_app.get("/api/tags")
-        def get_tags():
+        @self.settings_app.get("/api/tags", response_model=None)
+        async def get_tags():
             return {"tags": self.task_manager.get_all_tags()}
 
-        @self.settings_app.post("/api/tags")
-        def create_tag(name: str, color: Optional[str] = None):
+        @self.settings_app.post("/api/tags", response_model=None)
+        async def create_tag(name: str, color: Optional[str] = None):
             if self.task_manager.db:
-                tag = self.task_manager.db.save_tag(name, color)
+                tag = await asyncio.to_thread(self.task_manager.db.save_tag, name, color)
                 return {"success": True, "tag": tag}
             return {"success": False, "error": "Database not available"}
 
-        @self.settings_app.post("/api/tags/filter")
-        def set_tag_filter(tag: Optional[str] = None):
-            self.task_manager.set_tag_filter(tag)
+        @self.settings_app.post("/api/tags/filter", response_model=None)
+        async def set_tag_filter(tag: Optional[str] = None):
+            await asyncio.to_thread(self._call_locked, self.task_manager.set_tag_filter, tag)
             return {"success": True, "filter": self.task_manager.tag_filter}
 
-        @self.settings_app.delete("/api/tags/filter")
-        def clear_tag_filter():
-            self.task_manager.set_tag_filter(None)
+        @self.settings_app.delete("/api/tags/filter", response_model=None)
+        async def clear_tag_filter():
+            await asyncio.to_thread(self._call_locked, self.task_manager.set_tag_filter, None)
             return {"success": True, "filter": None}
 
-        @self.settings_app.get("/api/history")
-        def get_history(days: int = 7):
-            return self.task_manager.get_history(days)
+        @self.settings_app.get("/api/history", response_model=None)
+        async def get_history(days: int = 7):
+            return await asyncio.to_thread(self.task_manager.get_history, days)
 
-        @self.settings_app.get("/api/stats")
-        def get_stats():
+        @self.settings_app.get("/api/stats", response_model=None)
+        async def get_stats():
             return self.task_manager.get_stats()
 
-        @self.settings_app.get("/api/settings")
-        def get_settings():
+        @self.settings_app.get("/api/settings", response_model=None)
+        async def get_settings():
             return self.timer.get_status()["settings"]
 
-        @self.settings_app.put("/api/settings")
-        def update_settings(request: UpdateSettingsRequest):
-            self.timer.update_settings(
+        @self.settings_app.put("/api/settings", response_model=None)
+        async def update_settings(request: UpdateSettingsRequest):
+            await asyncio.to_thread(
+                self._call_locked,
+                self.timer.update_settings,
                 focus_duration=request.focus_duration,
                 short_break_duration=request.short_break_duration,
                 long_break_duration=request.long_break_duration,
@@ -453,32 +871,34 @@ class ReachyMiniPomodoro(ReachyMiniApp):
             )
             return {"success": True, "settings": self.timer.get_status()["settings"]}
 
-        @self.settings_app.post("/api/robot/celebrate")
-        def robot_celebrate():
+        @self.settings_app.post("/api/robot/celebrate", response_model=None)
+        async def robot_celebrate():
             self.movement_manager.start_movement(MovementType.CELEBRATION, duration=3.0)
+            self._wake_control_loop()
             return {"success": True}
 
-        @self.settings_app.post("/api/robot/demo-stretch")
-        def robot_demo_stretch():
+        @self.settings_app.post("/api/robot/demo-stretch", response_model=None)
+        async def robot_demo_stretch():
             self.movement_manager.start_movement(
                 MovementType.STRETCH_DEMO, duration=8.0
             )
+            self._wake_control_loop()
             return {"success": True}
 
-        @self.settings_app.post("/api/robot/demo-breathing")
-        def robot_demo_breathing():
+        @self.settings_app.post("/api/robot/demo-breathing", response_model=None)
+        async def robot_demo_breathing():
             self.movement_manager.start_movement(
                 MovementType.BREATHING_DEMO, duration=12.0
             )
+            self._wake_control_loop()
             return {"success": True}
 
-        @self.settings_app.get("/api/compita/status")
-        def get_compita_status():
+        @self.settings_app.get("/api/compita/status", response_model=None)
+        async def get_compita_status():
             """Get Compita voice assistant status."""
-            import os
             # Check both dashboard setting and environment variable
             has_api_key = bool(
-                self._compita_settings.openai_api_key or os.getenv("OPENAI_API_KEY")
+                self._compita_settings.openai_api_key or self._env_api_key
             )
             robot_voice_running = (
                 self._robot_voice_loop is not None
@@ -496,9 +916,9 @@ class ReachyMiniPomodoro(ReachyMiniApp):
             robot_voice_debug = {}
             if self._robot_voice_loop:
                 robot_voice_debug = {
-                    "input_sample_rate": getattr(self._robot_voice_loop, "_input_sample_rate", None),
-                    "output_sample_rate": getattr(self._robot_voice_loop, "_output_sample_rate", None),
-                    "session_active": self._robot_voice_loop._session is not None if hasattr(self._robot_voice_loop, "_session") else False,
+                    "input_sample_rate": self._robot_voice_loop._input_sample_rate,
+                    "output_sample_rate": self._robot_voice_loop._output_sample_rate,
+                    "session_active": self._robot_voice_loop._session is not None,
                 }
 
             return {
@@ -510,7 +930,7 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 "robot_voice_debug": robot_voice_debug,
             }
 
-        @self.settings_app.post("/api/compita/activate")
+        @self.settings_app.post("/api/compita/activate", response_model=None)
         async def activate_compita():
             """Manually activate Compita (useful when wake word detection isn't available)."""
             if self._robot_voice_loop and self._robot_voice_loop._session:
@@ -521,8 +941,8 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 return {"success": True, "message": "Compita activated"}
             return {"success": False, "message": "No active voice session"}
 
-        @self.settings_app.get("/api/compita/debug")
-        def get_compita_debug():
+        @self.settings_app.get("/api/compita/debug", response_model=None)
+        async def get_compita_debug():
             """Get detailed debug info for Compita voice."""
             debug = {
                 "robot_voice_loop": None,
@@ -536,8 +956,8 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                     "input_sample_rate": self._robot_voice_loop._input_sample_rate,
                     "output_sample_rate": self._robot_voice_loop._output_sample_rate,
                     "has_session": self._robot_voice_loop._session is not None,
-                    "audio_rms": getattr(self._robot_voice_loop, "_last_audio_rms", 0),
-                    "audio_max": getattr(self._robot_voice_loop, "_last_audio_max", 0),
+                    "audio_rms": self._robot_voice_loop._last_audio_rms,
+                    "audio_max": self._robot_voice_loop._last_audio_max,
                 }
 
                 if self._robot_voice_loop._session:
@@ -554,34 +974,26 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                             "running": agent._running,
                             "has_connection": agent._connection is not None,
                             "audio_chunks_sent": agent._audio_chunks_sent,
-                            "audio_chunks_received": getattr(agent, "_audio_chunks_received", 0),
-                            "speech_detected": getattr(agent, "_speech_detected", False),
-                            "last_event": getattr(agent, "_last_event", ""),
-                            "last_error": getattr(agent, "_last_error", ""),
+                            "audio_chunks_received": agent._audio_chunks_received,
+                            "speech_detected": agent._speech_detected,
+                            "last_event": agent._last_event,
+                            "last_error": agent._last_error,
                         }
 
             return debug
 
-        @self.settings_app.get("/api/compita/settings")
-        def get_compita_settings():
+        @self.settings_app.get("/api/compita/settings", response_model=None)
+        async def get_compita_settings():
             """Get Compita voice assistant settings."""
-            api_key = self._compita_settings.openai_api_key
-            masked_key = ""
-            if api_key:
-                if len(api_key) > 8:
-                    masked_key = api_key[:7] + "..." + api_key[-4:]
-                else:
-                    masked_key = "••••••••"
-
             return {
                 "enabled": self._compita_settings.enabled,
-                "openai_api_key": masked_key,
+                "openai_api_key": self._masked_api_key,
                 "voice": self._compita_settings.voice,
-                "has_api_key": bool(api_key),
+                "has_api_key": bool(self._compita_settings.openai_api_key),
                 "system_instructions": self._compita_settings.system_instructions,
             }
 
-        @self.settings_app.put("/api/compita/settings")
+        @self.settings_app.put("/api/compita/settings", response_model=None)
         def update_compita_settings(request: UpdateCompitaSettingsRequest):
             """Update Compita voice assistant settings."""
             restart_needed = False
@@ -595,6 +1007,7 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 new_key = request.openai_api_key.strip()
                 if new_key and not new_key.startswith("•") and new_key != "":
                     self._compita_settings.openai_api_key = new_key
+                    self._masked_api_key = _mask_api_key(new_key)
                     restart_needed = True
 
             if request.voice is not None:
@@ -637,36 +1050,62 @@ class ReachyMiniPomodoro(ReachyMiniApp):
             self.logger.info("Browser voice client connected")
 
             try:
-                from reachy_mini_pomodoro.voice.agent import (
-                    CompitaVoiceSession,
-                    SessionState,
-                )
-
-                # Create callbacks for this WebSocket
-                async def send_audio(audio_bytes: bytes):
-                    try:
-                        await websocket.send_bytes(audio_bytes)
-                    except Exception:
-                        pass
-
-                async def send_transcript(role: str, text: str):
-                    try:
-                        await websocket.send_json({
-                            "type": "transcript",
-                            "role": role,
-                            "text": text,
-                        })
-                    except Exception:
-                        pass
-
-                async def send_state(state: SessionState):
-                    try:
-                        await websocket.send_json({
-                            "type": "state",
-                            "state": state.value,
-                        })
-                    except Exception:
-                        pass
+                if CompitaVoiceSession is None:
+                    raise _VOICE_IMPORT_ERROR
+
+                # Outgoing messages go through one outbox and a single writer
+                # task instead of a task per audio frame. Only audio is bounded
+                outbox: Deque[Tuple[bool, object]] = deque()
+                outbox_ready = asyncio.Event()
+                audio_queued = 0
+
+                def enqueue(item: Tuple[bool, object]) -> None:
+                    nonlocal audio_queued
+                    if item[0]:
+                        if audio_queued >= _MAX_QUEUED_AUDIO_FRAMES:
+                            # Drop the oldest audio frame so playback stays current;
+                            # transcript and state messages are never dropped
+                            for i, queued in enumerate(outbox):
+                                if queued[0]:
+                                    del outbox[i]
+                                    break
+                        else:
+                            audio_queued += 1
+                    outbox.append(item)
+                    outbox_ready.set()
+
+                async def writer():
+                    nonlocal audio_queued
+                    while True:
+                        while not outbox:
+                            outbox_ready.clear()
+                            await outbox_ready.wait()
+                        is_bytes, payload = outbox.popleft()
+                        if is_bytes:
+                            audio_queued -= 1
+                        try:
+                            if is_bytes:
+                                await websocket.send_bytes(payload)
+                            else:
+                                await websocket.send_json(payload)
+                        except Exception:
+                            pass
+
+                def send_audio(audio_bytes: bytes) -> None:
+                    enqueue((True, audio_bytes))
+
+                def send_transcript(role: str, text: str) -> None:
+                    enqueue((False, {
+                        "type": "transcript",
+                        "role": role,
+                        "text": text,
+                    }))
+
+                def send_state(state: SessionState) -> None:
+                    enqueue((False, {
+                        "type": "state",
+                        "state": state.value,
+                    }))
 
                 # Create session with wake word detection
                 # Pass None if no API key set so it falls back to env var
@@ -679,36 +1118,43 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                     model=self._compita_settings.model,
                     voice=self._compita_settings.voice,
                     system_instructions=self._compita_settings.system_instructions,
-                    on_audio_output=lambda b: asyncio.create_task(send_audio(b)),
-                    on_transcript=lambda r, t: asyncio.create_task(send_transcript(r, t)),
-                    on_state_change=lambda s: asyncio.create_task(send_state(s)),
+                    on_audio_output=send_audio,
+                    on_transcript=send_transcript,
+                    on_state_change=send_state,
+                    state_call=self._call_locked,
                 )
                 session.start()
                 self._active_voice_session = session  # Store for notifications
 
-                # Start timeout checker in background
+                # Start timeout checker and outgoing writer in background
                 timeout_task = asyncio.create_task(session.run_timeout_checker())
+                writer_task = asyncio.create_task(writer())
 
                 # Receive audio/messages from browser
+                receive = websocket.receive
+                process_audio = session.process_audio
                 try:
                     while True:
-                        data = await websocket.receive()
-                        msg_type = data.get("type", "")
+                        data = await receive()
+
+                        # Audio frames dominate the traffic, so test for them first
+                        audio = data.get("bytes")
+                        if audio is not None:
+                            await process_audio(audio)
+                            continue
 
                         # Check for disconnect
-                        if msg_type == "websocket.disconnect":
+                        if data["type"] == "websocket.disconnect":
                             break
 
-                        if "bytes" in data:
-                            await session.process_audio(data["bytes"])
-                        elif "text" in data:
-                            msg = data["text"]
+                        msg = data.get("text")
+                        if msg is not None:
                             if msg == "close":
                                 break
                             # Handle wake word from browser speech recognition
                             elif msg.startswith("transcript:"):
                                 text = msg[11:]
-                                self.logger.info(f"Received transcript: {text}")
+                                self.logger.info("Received transcript: %s", text)
                                 await session.handle_user_transcript(text)
                             # Manual activation (button press)
                             elif msg == "activate":
@@ -716,17 +1162,19 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 except WebSocketDisconnect:
                     pass
                 except Exception as e:
-                    self.logger.debug(f"WebSocket receive error: {e}")
+                    self.logger.debug("WebSocket receive error: %s", e)
                 finally:
                     session.stop()
                     timeout_task.cancel()
+                    writer_task.cancel()
 
             except Exception as e:
-                self.logger.error(f"Voice stream error: {e}")
+                self.logger.error("Voice stream error: %s", e)
             finally:
                 self.logger.info("Browser voice client disconnected")
 
     def wrapped_run(self) -> None:
+        server = None
         settings_app_t = None
         if self.settings_app is not None:
             assert self.custom_app_url is not None
@@ -737,24 +1185,27 @@ class ReachyMiniPomodoro(ReachyMiniApp):
                 self.settings_app,
                 host=url.hostname,
                 port=url.port,
+                loop=_UVICORN_LOOP,
+                http=_UVICORN_HTTP,
+                ws="websockets",
+                backlog=128,
+                # Dashboard polls would otherwise format a log record per request
+                log_level="warning",
+                access_log=False,
             )
             server = uvicorn.Server(config)
-
-            def _server_run() -> None:
-                t = threading.Thread(target=server.run)
-                t.start()
-                self.stop_event.wait()
-                server.should_exit = True
-                t.join()
-
-            settings_app_t = threading.Thread(target=_server_run)
+            settings_app_t = threading.Thread(target=server.run, daemon=True)
             settings_app_t.start()
 
         try:
+            # stop() may already have been called while the server was starting;
+            # don't connect to the robot only to disconnect again
+            if self.stop_event.is_set():
+                return
             media_backend = self._media_backend_override or self.media_backend
             self.logger.info("Starting Reachy Mini app...")
-            self.logger.info(f"Using media backend: {media_backend}")
-            self.logger.info(f"Localhost only: {self.localhost_only}")
+            self.logger.info("Using media backend: %s", media_backend)
+            self.logger.info("Localhost only: %s", self.localhost_only)
             with ReachyMini(
                 media_backend=media_backend,
                 localhost_only=self.localhost_only,
@@ -765,8 +1216,12 @@ class ReachyMiniPomodoro(ReachyMiniApp):
             raise
         finally:
             if settings_app_t is not None:
+                # run() only returns once stop_event is set, so the server can
+                # be told to exit here without a separate watcher thread. Nothing
+                # waits on stop_event for this, so there is no set-before-wait race
                 self.stop_event.set()
-                settings_app_t.join()
+                server.should_exit = True
+                settings_app_t.join(timeout=5)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,350 @@ import math
 import random
 import time
 import threading
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 import numpy as np
-from scipy.spatial.transform import Rotation as R
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; kernels then run as plain Python
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def _pose_matrix(roll: float, pitch: float, yaw: float,
+                 x: float, y: float, z: float, pose: np.ndarray) -> np.ndarray:
+    """Fill a 4x4 pose from extrinsic xyz Euler angles (radians) and position (m).
+
+    Only the top 3x4 block is written; the bottom row of `pose` must already
+    be [0, 0, 0, 1] (see _new_pose_buffer).
+    """
+    # Most animations move one or two axes; a zero angle needs no sin/cos
+    # (cos(0) == 1 and sin(0) == 0 exactly, so the result is unchanged)
+    if roll == 0.0:
+        cr, sr = 1.0, 0.0
+    else:
+        cr, sr = math.cos(roll), math.sin(roll)
+    if pitch == 0.0:
+        cp, sp = 1.0, 0.0
+    else:
+        cp, sp = math.cos(pitch), math.sin(pitch)
+    if yaw == 0.0:
+        cy, sy = 1.0, 0.0
+    else:
+        cy, sy = math.cos(yaw), math.sin(yaw)
+
+    # Rz(yaw) @ Ry(pitch) @ Rx(roll), same as Rotation.from_euler("xyz", ...)
+    pose[0, 0] = cy * cp
+    pose[0, 1] = cy * sp * sr - sy * cr
+    pose[0, 2] = cy * sp * cr + sy * sr
+    pose[0, 3] = x
+    pose[1, 0] = sy * cp
+    pose[1, 1] = sy * sp * sr + cy * cr
+    pose[1, 2] = sy * sp * cr - cy * sr
+    pose[1, 3] = y
+    pose[2, 0] = -sp
+    pose[2, 1] = cp * sr
+    pose[2, 2] = cp * cr
+    pose[2, 3] = z
+    return pose
+
+
+# Working precision of the pose/antenna scratch buffers. Servo targets need far
+# less than float64; callers' float64 output buffers convert on copy.
+_POSE_DTYPE = np.float32
+
+
+_DEG2RAD = math.pi / 180.0  # Same factor math.radians uses
+
+
+@njit(cache=True, fastmath=True)
+def _pose_matrix_deg_mm(roll: float, pitch: float, yaw: float,
+                        x: float, y: float, z: float, pose: np.ndarray) -> np.ndarray:
+    """_pose_matrix taking degrees and millimetres, converted inside the kernel."""
+    return _pose_matrix(
+        roll * _DEG2RAD, pitch * _DEG2RAD, yaw * _DEG2RAD,
+        x / 1000, y / 1000, z / 1000,
+        pose,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _compose_pose(base: np.ndarray, offset: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Write base @ offset into out for rigid transforms.
+
+    Both inputs must have a [0, 0, 0, 1] bottom row, so only the top 3x4
+    block of out is written (see _pose_matrix).
+    """
+    for i in range(3):
+        b0 = base[i, 0]
+        b1 = base[i, 1]
+        b2 = base[i, 2]
+        out[i, 0] = b0 * offset[0, 0] + b1 * offset[1, 0] + b2 * offset[2, 0]
+        out[i, 1] = b0 * offset[0, 1] + b1 * offset[1, 1] + b2 * offset[2, 1]
+        out[i, 2] = b0 * offset[0, 2] + b1 * offset[1, 2] + b2 * offset[2, 2]
+        out[i, 3] = b0 * offset[0, 3] + b1 * offset[1, 3] + b2 * offset[2, 3] + base[i, 3]
+    return out
+
+
+def _new_pose_buffer() -> np.ndarray:
+    """4x4 buffer for _pose_matrix, with the constant homogeneous row in place."""
+    return np.eye(4, dtype=_POSE_DTYPE)
+
+
+# Angular frequencies (rad/s) of the periodic animations, folded once here
+_TAU = 2 * math.pi
+_OMEGA_IDLE = _TAU * 0.15
+_OMEGA_IDLE_ANTENNA = _TAU * 0.2
+_OMEGA_BREATHING = _TAU * 0.1
+_OMEGA_TALK_NOD_FAST = _TAU * 2.5
+_OMEGA_TALK_NOD_SLOW = _TAU * 0.8
+_OMEGA_TALK_ROLL = _TAU * 0.6
+_OMEGA_TALK_YAW = _TAU * 0.4
+_OMEGA_TALK_ANTENNA = _TAU * 1.5
+_OMEGA_LISTEN_ROLL = _TAU * 0.4
+_OMEGA_LISTEN_YAW = _TAU * 0.25
+_OMEGA_LISTEN_ANTENNA = _TAU * 0.6
+_OMEGA_LISTEN_FLUTTER = _TAU * 1.5
+_OMEGA_CELEBRATION_BOUNCE = _TAU * 1.0
+_OMEGA_CELEBRATION_SWAY = _TAU * 0.5
+_OMEGA_CELEBRATION_ANTENNA = _TAU * 0.8  # Slowed from 4.0
+_OMEGA_LOOK_YAW = _TAU * 0.3
+_OMEGA_LOOK_PITCH = _TAU * 0.2
+_OMEGA_LOOK_ANTENNA = _TAU * 0.4
+
+# 256-step sine table for the periodic animation waves: linear interpolation is
+# accurate to ~1e-4, far below what a few degrees/millimetres of motion shows
+_SIN_LUT_SIZE = 256
+# One spare entry past 2*pi keeps i + 1 in range even if phase rounds up to the size
+_SIN_LUT = np.sin(np.arange(_SIN_LUT_SIZE + 2) * (_TAU / _SIN_LUT_SIZE))
+
+
+@njit(cache=True, fastmath=True)
+def _lut_sin(x: float) -> float:
+    phase = (x * (_SIN_LUT_SIZE / _TAU)) % _SIN_LUT_SIZE
+    i = int(phase)
+    frac = phase - i
+    return _SIN_LUT[i] + frac * (_SIN_LUT[i + 1] - _SIN_LUT[i])
+
+
+# Interpreted, a table lookup costs more than math.sin, so only use it compiled
+_wave_sin = _lut_sin if _HAS_NUMBA else math.sin
+
+
+# Continuous animations as pure functions of time, compiled with the pose kernel.
+# Each returns (roll, pitch, yaw, x, y, z, right_antenna, left_antenna) in the
+# units _create_pose takes: degrees and millimetres.
+
+@njit(cache=True, fastmath=True)
+def _idle_kernel(t: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    wave = _wave_sin(_OMEGA_IDLE * t)
+    pitch = 2 * wave
+    z = 3 * wave
+    antenna_offset = 0.05 * _wave_sin(_OMEGA_IDLE_ANTENNA * t)
+    return 0.0, pitch, 0.0, 0.0, 0.0, z, antenna_offset, -antenna_offset
+
+
+@njit(cache=True, fastmath=True)
+def _breathing_kernel(elapsed: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    wave = _wave_sin(_OMEGA_BREATHING * elapsed)
+    pitch = 5 * wave
+    z = 8 * wave
+    antenna_base = 0.3  # Raised position
+    antenna_variation = 0.1 * wave
+    return (0.0, pitch, 0.0, 0.0, 0.0, z,
+            antenna_base + antenna_variation, antenna_base - antenna_variation)
+
+
+@njit(cache=True, fastmath=True)
+def _talking_kernel(elapsed: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    nod_fast = 3 * _wave_sin(_OMEGA_TALK_NOD_FAST * elapsed)  # Fast subtle nods
+    nod_slow = 2 * _wave_sin(_OMEGA_TALK_NOD_SLOW * elapsed)  # Slower emphasis nods
+    pitch = nod_fast + nod_slow
+    roll = 2 * _wave_sin(_OMEGA_TALK_ROLL * elapsed + 0.5)
+    yaw = 3 * _wave_sin(_OMEGA_TALK_YAW * elapsed)
+    antenna_base = 0.25
+    antenna_wiggle = 0.1 * _wave_sin(_OMEGA_TALK_ANTENNA * elapsed)
+    return (roll, pitch, yaw, 0.0, 0.0, 0.0,
+            antenna_base + antenna_wiggle, antenna_base - antenna_wiggle)
+
+
+@njit(cache=True, fastmath=True)
+def _celebration_kernel(elapsed: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    z = 15 * abs(_wave_sin(_OMEGA_CELEBRATION_BOUNCE * elapsed))
+    yaw = 20 * _wave_sin(_OMEGA_CELEBRATION_SWAY * elapsed)
+    roll = 15 * _wave_sin(_OMEGA_CELEBRATION_SWAY * elapsed + math.pi / 4)
+    antenna_wave = 0.6 * _wave_sin(_OMEGA_CELEBRATION_ANTENNA * elapsed)
+    return roll, 0.0, yaw, 0.0, 0.0, z, antenna_wave, -antenna_wave
+
+
+@njit(cache=True, fastmath=True)
+def _look_around_kernel(elapsed: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    yaw = 30 * _wave_sin(_OMEGA_LOOK_YAW * elapsed)
+    pitch = 10 * _wave_sin(_OMEGA_LOOK_PITCH * elapsed + 0.5)
+    antenna_offset = 0.3 * _wave_sin(_OMEGA_LOOK_ANTENNA * elapsed)
+    return (0.0, pitch, yaw, 0.0, 0.0, 0.0,
+            0.3 + antenna_offset, 0.3 - antenna_offset)
+
+
+@njit(cache=True, fastmath=True)
+def _breathing_demo_kernel(elapsed: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    cycle_duration = 12.0
+    cycle_pos = (elapsed % cycle_duration) / cycle_duration
+
+    if cycle_pos < 0.33:
+        p = cycle_pos / 0.33
+        z = 20 * p
+        pitch = -10 * p
+    elif cycle_pos < 0.66:
+        z = 20.0
+        pitch = -10.0
+    else:
+        p = (cycle_pos - 0.66) / 0.34
+        z = 20 * (1 - p)
+        pitch = -10 * (1 - p)
+
+    antenna_pos = 0.4 * (z / 20)
+    return 0.0, pitch, 0.0, 0.0, 0.0, z, antenna_pos, antenna_pos
+
+
+@njit(cache=True, fastmath=True)
+def _listening_kernel(elapsed: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    roll = 2 * _wave_sin(_OMEGA_LISTEN_ROLL * elapsed)
+    yaw = 3 * _wave_sin(_OMEGA_LISTEN_YAW * elapsed)
+    antenna_base = 0.45
+    antenna_wave = 0.15 * _wave_sin(_OMEGA_LISTEN_ANTENNA * elapsed)
+    antenna_flutter = 0.05 * _wave_sin(_OMEGA_LISTEN_FLUTTER * elapsed)
+    right = antenna_base + antenna_wave + antenna_flutter
+    left = antenna_base + 0.12 * _wave_sin(_OMEGA_LISTEN_ANTENNA * elapsed + 0.3) + antenna_flutter
+    return roll, -5.0, yaw, 0.0, 0.0, 0.0, right, left
+
+
+# Segmented animations: compiled, their range checks are native compares
+# rather than interpreter branches. Same return layout as the kernels above.
+
+@njit(cache=True, fastmath=True)
+def _focus_start_kernel(progress: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    if progress < 0.3:
+        p = progress / 0.3
+        wave = math.sin(math.pi * p)
+        pitch = -15 * wave
+        roll = 10 * wave
+    elif progress < 0.6:
+        p = (progress - 0.3) / 0.3
+        pitch = -15 * (1 - p) * math.sin(math.pi * 0.5)
+        roll = 10 * (1 - p)
+    else:
+        pitch = 0.0
+        roll = 0.0
+
+    antenna_up = 0.5 * min(1.0, progress * 2)
+    return roll, pitch, 0.0, 0.0, 0.0, 0.0, antenna_up, antenna_up
+
+
+@njit(cache=True, fastmath=True)
+def _focus_reminder_kernel(progress: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    if progress < 0.5:
+        p = progress / 0.5
+        wave = math.sin(math.pi * p)
+        roll = 8 * wave
+        yaw = 5 * wave
+    else:
+        p = (progress - 0.5) / 0.5
+        roll = 8 * (1 - p)
+        yaw = 5 * (1 - p)
+    return roll, 0.0, yaw, 0.0, 0.0, 0.0, 0.2, 0.2
+
+
+@njit(cache=True, fastmath=True)
+def _break_start_kernel(progress: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    if progress < 0.4:
+        p = progress / 0.4
+        pitch = -10 * p
+        z = 10 * p
+    else:
+        p = (progress - 0.4) / 0.6
+        pitch = -10 + 15 * p
+        z = 10 - 5 * p
+
+    antenna_pos = 0.4 * (1 - progress)
+    return 0.0, pitch, 0.0, 0.0, 0.0, z, antenna_pos, antenna_pos
+
+
+@njit(cache=True, fastmath=True)
+def _task_complete_kernel(elapsed: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    if elapsed < 1.0:
+        wave = math.sin(math.pi * elapsed)
+        z = 20 * wave
+        pitch = -15 * wave
+        antenna_up = 0.7
+    else:
+        p = min(1.0, elapsed - 1.0)
+        z = 0.0
+        pitch = 0.0
+        antenna_up = 0.7 * (1 - p)
+    return 0.0, pitch, 0.0, 0.0, 0.0, z, antenna_up, antenna_up
+
+
+@njit(cache=True, fastmath=True)
+def _stretch_demo_kernel(progress: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    cycle = progress * 4
+    pitch = 0.0
+    yaw = 0.0
+    if cycle < 1:
+        yaw = 25 * math.sin(math.pi * cycle)
+    elif cycle < 2:
+        yaw = -25 * math.sin(math.pi * (cycle - 1))
+    elif cycle < 3:
+        pitch = -20 * math.sin(math.pi * (cycle - 2))
+    else:
+        pitch = 15 * math.sin(math.pi * (cycle - 3))
+    return 0.0, pitch, yaw, 0.0, 0.0, 0.0, 0.2, 0.2
+
+
+@njit(cache=True, fastmath=True)
+def _focus_complete_kernel(progress: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    bounce = math.sin(math.pi * progress * 2) * (1 - progress)  # Slowed from 4
+    z = 15 * bounce
+    pitch = -10 * bounce
+    antenna_wave = 0.5 * math.sin(math.pi * progress * 3)  # Slowed from 6
+    return 0.0, pitch, 0.0, 0.0, 0.0, z, 0.3 + antenna_wave, 0.3 - antenna_wave
+
+
+@njit(cache=True, fastmath=True)
+def _nod_yes_kernel(progress: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    nod_cycle = progress * 2
+    pitch = -12 * math.sin(math.pi * nod_cycle * 2)
+    return 0.0, pitch, 0.0, 0.0, 0.0, 0.0, 0.2, 0.2
+
+
+@njit(cache=True, fastmath=True)
+def _nod_no_kernel(progress: float) -> Tuple[float, float, float, float, float, float, float, float]:
+    shake_cycle = progress * 2
+    yaw = 15 * math.sin(math.pi * shake_cycle * 2)
+    return 0.0, 0.0, yaw, 0.0, 0.0, 0.0, -0.2, -0.2
+
+
+def _constant(values) -> np.ndarray:
+    """Read-only array shared by every call that returns it."""
+    array = np.array(values, dtype=_POSE_DTYPE)
+    array.setflags(write=False)
+    return array
+
+
+# Fixed antenna positions returned as-is by the pose functions that hold them still
+_ANTENNAS_UP = _constant([0.2, 0.2])
+_ANTENNAS_DOWN = _constant([-0.2, -0.2])
 
 
 class MovementType(Enum):
@@ -32,30 +370,30 @@ class MovementType(Enum):
     BREATHING_DEMO = "breathing_demo"
 
 
-@dataclass
+@dataclass(slots=True)
 class MovementState:
     """Current state of a movement animation."""
     movement_type: MovementType
-    start_time: float
+    start_time: float  # time.monotonic() seconds
     duration: float
     loop: bool = False
     data: Optional[dict] = None
 
-    @property
-    def elapsed(self) -> float:
-        return time.time() - self.start_time
+    # These take the caller's time.monotonic() reading, so one update() tick
+    # reads the clock once however many of them it uses
+    def elapsed_at(self, now: float) -> float:
+        return now - self.start_time
 
-    @property
-    def progress(self) -> float:
+    def progress_at(self, now: float) -> float:
+        elapsed = now - self.start_time
         if self.loop:
-            return (self.elapsed % self.duration) / self.duration
-        return min(1.0, self.elapsed / self.duration)
+            return (elapsed % self.duration) / self.duration
+        return min(1.0, elapsed / self.duration)
 
-    @property
-    def is_complete(self) -> bool:
+    def is_complete_at(self, now: float) -> bool:
         if self.loop:
             return False
-        return self.elapsed >= self.duration
+        return now - self.start_time >= self.duration
 
 
 class MovementManager:
@@ -66,41 +404,103 @@ class MovementManager:
     2. Speech offsets - audio-driven head wobble layered on top of primary movements
     """
 
+    # Movements that look the same whether or not they are restarted
+    _RESTART_INVARIANT = frozenset({MovementType.IDLE})
+
     def __init__(self) -> None:
         self.current_movement: Optional[MovementState] = None
-        self.queued_movements: list[MovementState] = []
-        self._base_time = time.time()
+        self.queued_movements: deque[MovementState] = deque()
+        # Guards current/queued movements: they are set from API, voice and
+        # timer event threads while the control loop advances them
+        self._movement_lock = threading.Lock()
+        self._base_time = time.monotonic()
 
         self._speech_offsets: Tuple[float, float, float, float, float, float] = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
         self._speech_offsets_lock = threading.Lock()
+        # Whether any offset is non-zero; read without the lock every tick
+        self._speech_offsets_active = False
         self._is_listening = False
 
+        # Scratch buffers reused by _create_pose and _set_antennas every tick
+        self._pose_buf = _new_pose_buffer()
+        self._antenna_buf = np.empty(2, dtype=_POSE_DTYPE)
+        # Speech offset transform and the offset-applied head pose
+        self._offset_buf = _new_pose_buffer()
+        self._speech_pose_buf = _new_pose_buffer()
+        # Compile the kernels now rather than on the first control loop tick
+        _pose_matrix(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, self._pose_buf)
+        _pose_matrix_deg_mm(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, self._pose_buf)
+        _compose_pose(self._pose_buf, self._offset_buf, self._speech_pose_buf)
+        for kernel in (_idle_kernel, _breathing_kernel, _talking_kernel,
+                       _celebration_kernel, _look_around_kernel, _breathing_demo_kernel,
+                       _listening_kernel, _focus_start_kernel, _focus_reminder_kernel,
+                       _focus_complete_kernel, _break_start_kernel, _task_complete_kernel,
+                       _nod_yes_kernel, _nod_no_kernel, _stretch_demo_kernel):
+            kernel(0.0)
+
     def start_movement(self, movement_type: MovementType, duration: float = 2.0,
                        loop: bool = False, data: Optional[dict] = None) -> None:
         """Start a new movement, replacing any current movement."""
-        self.current_movement = MovementState(
-            movement_type=movement_type,
-            start_time=time.time(),
-            duration=duration,
-            loop=loop,
-            data=data,
-        )
+        now = time.monotonic()
+        with self._movement_lock:
+            if self._is_running(movement_type, now):
+                return
+            self.current_movement = MovementState(
+                movement_type=movement_type,
+                start_time=now,
+                duration=duration,
+                loop=loop,
+                data=data,
+            )
 
     def queue_movement(self, movement_type: MovementType, duration: float = 2.0,
                        loop: bool = False, data: Optional[dict] = None) -> None:
         """Queue a movement to play after the current one."""
-        self.queued_movements.append(MovementState(
+        movement = MovementState(
             movement_type=movement_type,
             start_time=0,  # Will be set when it starts
             duration=duration,
             loop=loop,
             data=data,
-        ))
+        )
+        with self._movement_lock:
+            self.queued_movements.append(movement)
+
+    def start_movement_fast(self, movement_type: MovementType, duration: float,
+                            loop: bool = False, /) -> None:
+        """Positional-only start_movement for callers on the event path."""
+        now = time.monotonic()
+        with self._movement_lock:
+            if not self._is_running(movement_type, now):
+                self.current_movement = MovementState(movement_type, now, duration, loop)
+
+    def queue_movement_fast(self, movement_type: MovementType, duration: float,
+                            loop: bool = False, /) -> None:
+        """Positional-only queue_movement for callers on the event path."""
+        movement = MovementState(movement_type, 0, duration, loop)
+        with self._movement_lock:
+            self.queued_movements.append(movement)
+
+    def _is_running(self, movement_type: MovementType, now: float) -> bool:
+        """Whether restarting movement_type now would be a no-op.
+
+        Only applies to movements whose pose doesn't depend on their start
+        time (IDLE), so restarting one would just allocate a new state.
+        Call with _movement_lock held.
+        """
+        current = self.current_movement
+        return (
+            movement_type in self._RESTART_INVARIANT
+            and current is not None
+            and current.movement_type is movement_type
+            and not current.is_complete_at(now)
+        )
 
     def stop_movement(self) -> None:
         """Stop the current movement and return to idle."""
-        self.current_movement = None
-        self.queued_movements.clear()
+        with self._movement_lock:
+            self.current_movement = None
+            self.queued_movements.clear()
 
     def set_speech_offsets(self, offsets: Tuple[float, float, float, float, float, float]) -> None:
         """Set speech-driven head movement offsets.
@@ -112,73 +512,68 @@ class MovementManager:
         """
         with self._speech_offsets_lock:
             self._speech_offsets = offsets
+            self._speech_offsets_active = any(offsets)
 
     def clear_speech_offsets(self) -> None:
         """Reset speech offsets to zero."""
         with self._speech_offsets_lock:
             self._speech_offsets = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            self._speech_offsets_active = False
 
     def set_listening(self, listening: bool) -> None:
         """Set whether the robot is listening (affects subtle animations)."""
         self._is_listening = listening
 
-    def update(self) -> Tuple[np.ndarray, np.ndarray, float]:
+    def update(self, out_head: Optional[np.ndarray] = None,
+               out_antennas: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, float]:
         """
         Update and return the current pose.
 
+        Args:
+            out_head: Optional 4x4 buffer to write the head pose into.
+            out_antennas: Optional length-2 buffer to write the antennas into.
+
         Returns:
             Tuple of (head_pose 4x4, antennas [right, left], body_yaw)
         """
-        if self.current_movement and self.current_movement.is_complete:
-            if self.queued_movements:
-                next_move = self.queued_movements.pop(0)
-                next_move.start_time = time.time()
-                self.current_movement = next_move
-            else:
-                self.current_movement = None
-
-        if self.current_movement is None:
-            pose, antennas, body_yaw = self._idle_pose()
+        # One monotonic clock read per tick; elapsed/progress/completion and the
+        # idle animation all derive from it, and wall-clock jumps can't skew them
+        now = time.monotonic()
+        with self._movement_lock:
+            current = self.current_movement
+            if current and current.is_complete_at(now):
+                if self.queued_movements:
+                    current = self.queued_movements.popleft()
+                    current.start_time = now
+                else:
+                    current = None
+                self.current_movement = current
+
+        entry = None if current is None else self._POSE_DISPATCH.get(current.movement_type)
+        if entry is None:
+            # No movement, IDLE, or a type without an animation
+            pose, antennas, body_yaw = self._idle_pose(now)
         else:
-            movement_type = self.current_movement.movement_type
-            progress = self.current_movement.progress
-            elapsed = self.current_movement.elapsed
-
-            if movement_type == MovementType.IDLE:
-                pose, antennas, body_yaw = self._idle_pose()
-            elif movement_type == MovementType.BREATHING:
-                pose, antennas, body_yaw = self._breathing_pose(elapsed)
-            elif movement_type == MovementType.TALKING:
-                pose, antennas, body_yaw = self._talking_pose(elapsed)
-            elif movement_type == MovementType.LISTENING:
-                pose, antennas, body_yaw = self._listening_pose(elapsed)
-            elif movement_type == MovementType.FOCUS_START:
-                pose, antennas, body_yaw = self._focus_start_pose(progress)
-            elif movement_type == MovementType.FOCUS_REMINDER:
-                pose, antennas, body_yaw = self._focus_reminder_pose(progress)
-            elif movement_type == MovementType.FOCUS_COMPLETE:
-                pose, antennas, body_yaw = self._focus_complete_pose(progress)
-            elif movement_type == MovementType.BREAK_START:
-                pose, antennas, body_yaw = self._break_start_pose(progress)
-            elif movement_type == MovementType.CELEBRATION:
-                pose, antennas, body_yaw = self._celebration_pose(elapsed)
-            elif movement_type == MovementType.TASK_COMPLETE:
-                pose, antennas, body_yaw = self._task_complete_pose(elapsed)
-            elif movement_type == MovementType.NOD_YES:
-                pose, antennas, body_yaw = self._nod_yes_pose(progress)
-            elif movement_type == MovementType.NOD_NO:
-                pose, antennas, body_yaw = self._nod_no_pose(progress)
-            elif movement_type == MovementType.LOOK_AROUND:
-                pose, antennas, body_yaw = self._look_around_pose(elapsed)
-            elif movement_type == MovementType.STRETCH_DEMO:
-                pose, antennas, body_yaw = self._stretch_demo_pose(progress)
-            elif movement_type == MovementType.BREATHING_DEMO:
-                pose, antennas, body_yaw = self._breathing_demo_pose(elapsed)
+            pose_fn, by_progress = entry
+            if by_progress:
+                pose, antennas, body_yaw = pose_fn(self, current.progress_at(now))
             else:
-                pose, antennas, body_yaw = self._idle_pose()
+                pose, antennas, body_yaw = pose_fn(self, current.elapsed_at(now))
 
         pose = self._apply_speech_offsets(pose)
 
+        if out_head is not None:
+            np.copyto(out_head, pose)
+            pose = out_head
+        elif pose is self._pose_buf or pose is self._speech_pose_buf:
+            # Don't hand the scratch buffer to the caller; widen it while copying
+            pose = pose.astype(np.float64)
+        if out_antennas is not None:
+            np.copyto(out_antennas, antennas)
+            antennas = out_antennas
+        elif antennas is self._antenna_buf or not antennas.flags.writeable:
+            antennas = antennas.astype(np.float64)  # Don't hand out scratch or shared arrays
+
         return pose, antennas, body_yaw
 
     def _apply_speech_offsets(self, base_pose: np.ndarray) -> np.ndarray:
@@ -188,262 +583,150 @@ class MovementManager:
             base_pose: The 4x4 pose matrix from the primary movement.
 
         Returns:
-            Modified 4x4 pose matrix with speech offsets applied.
+            Modified 4x4 pose matrix with speech offsets applied, written into
+            a scratch buffer that the next call overwrites.
         """
+        # Skip the lock entirely while not talking
+        if not self._speech_offsets_active:
+            return base_pose
         with self._speech_offsets_lock:
             x, y, z, roll, pitch, yaw = self._speech_offsets
 
-        if x == 0 and y == 0 and z == 0 and roll == 0 and pitch == 0 and yaw == 0:
-            return base_pose
-
-        offset_pose = np.eye(4)
-        offset_pose[:3, :3] = R.from_euler(
-            "xyz", [math.degrees(roll), math.degrees(pitch), math.degrees(yaw)], degrees=True
-        ).as_matrix()
-        offset_pose[:3, 3] = [x, y, z]
+        offset_pose = _pose_matrix(roll, pitch, yaw, x, y, z, self._offset_buf)
+        if _HAS_NUMBA:
+            # Fixed-size compose skips np.matmul's dispatch for a 4x4
+            return _compose_pose(base_pose, offset_pose, self._speech_pose_buf)
+        return np.matmul(base_pose, offset_pose, out=self._speech_pose_buf)
 
-        return base_pose @ offset_pose
+    def _set_antennas(self, right: float, left: float) -> np.ndarray:
+        """Write [right, left] into the antenna scratch buffer and return it."""
+        buf = self._antenna_buf
+        buf[0] = right
+        buf[1] = left
+        return buf
 
     def _create_pose(self, roll: float = 0, pitch: float = 0, yaw: float = 0,
                      x: float = 0, y: float = 0, z: float = 0) -> np.ndarray:
-        """Create a 4x4 pose matrix from euler angles (degrees) and position (mm)."""
-        pose = np.eye(4)
-        pose[:3, :3] = R.from_euler("xyz", [roll, pitch, yaw], degrees=True).as_matrix()
-        pose[:3, 3] = [x / 1000, y / 1000, z / 1000]  # Convert mm to m
-        return pose
-
-    def _idle_pose(self) -> Tuple[np.ndarray, np.ndarray, float]:
-        """Subtle idle breathing animation."""
-        t = time.time() - self._base_time
-        pitch = 2 * math.sin(2 * math.pi * 0.15 * t)
-        z = 3 * math.sin(2 * math.pi * 0.15 * t)
+        """Create a 4x4 pose matrix from euler angles (degrees) and position (mm).
 
-        antenna_offset = 0.05 * math.sin(2 * math.pi * 0.2 * t)
+        The returned array is the manager's scratch buffer and is overwritten
+        by the next call.
+        """
+        return _pose_matrix_deg_mm(roll, pitch, yaw, x, y, z, self._pose_buf)
 
-        pose = self._create_pose(pitch=pitch, z=z)
-        antennas = np.array([antenna_offset, -antenna_offset])
-        return pose, antennas, 0.0
+    def _idle_pose(self, now: float) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Subtle idle breathing animation."""
+        t = now - self._base_time
+        roll, pitch, yaw, x, y, z, right, left = _idle_kernel(t)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _breathing_pose(self, elapsed: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Calm breathing animation for focus time."""
-        pitch = 5 * math.sin(2 * math.pi * 0.1 * elapsed)
-        z = 8 * math.sin(2 * math.pi * 0.1 * elapsed)
-
-        antenna_base = 0.3  # Raised position
-        antenna_variation = 0.1 * math.sin(2 * math.pi * 0.1 * elapsed)
-
-        pose = self._create_pose(pitch=pitch, z=z)
-        antennas = np.array([antenna_base + antenna_variation, antenna_base - antenna_variation])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _breathing_kernel(elapsed)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _talking_pose(self, elapsed: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Subtle talking animation - small nods and tilts like natural speech."""
-        nod_fast = 3 * math.sin(2 * math.pi * 2.5 * elapsed)  # Fast subtle nods
-        nod_slow = 2 * math.sin(2 * math.pi * 0.8 * elapsed)  # Slower emphasis nods
-        pitch = nod_fast + nod_slow
-
-        roll = 2 * math.sin(2 * math.pi * 0.6 * elapsed + 0.5)
-
-        yaw = 3 * math.sin(2 * math.pi * 0.4 * elapsed)
-
-        antenna_base = 0.25
-        antenna_wiggle = 0.1 * math.sin(2 * math.pi * 1.5 * elapsed)
-
-        pose = self._create_pose(roll=roll, pitch=pitch, yaw=yaw)
-        antennas = np.array([antenna_base + antenna_wiggle, antenna_base - antenna_wiggle])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _talking_kernel(elapsed)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _listening_pose(self, elapsed: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Attentive listening pose - focused attention with expressive antennas."""
-        pitch = -5
-        roll = 2 * math.sin(2 * math.pi * 0.4 * elapsed)
-        yaw = 3 * math.sin(2 * math.pi * 0.25 * elapsed)
-
-        antenna_base = 0.45
-        antenna_wave = 0.15 * math.sin(2 * math.pi * 0.6 * elapsed)
-        antenna_flutter = 0.05 * math.sin(2 * math.pi * 1.5 * elapsed)
-
-        right_antenna = antenna_base + antenna_wave + antenna_flutter
-        left_antenna = antenna_base + 0.12 * math.sin(2 * math.pi * 0.6 * elapsed + 0.3) + antenna_flutter
-
-        pose = self._create_pose(roll=roll, pitch=pitch, yaw=yaw)
-        antennas = np.array([right_antenna, left_antenna])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _listening_kernel(elapsed)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _focus_start_pose(self, progress: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Animation when starting a focus session."""
-        if progress < 0.3:
-            p = progress / 0.3
-            pitch = -15 * math.sin(math.pi * p)
-            roll = 10 * math.sin(math.pi * p)
-        elif progress < 0.6:
-            p = (progress - 0.3) / 0.3
-            pitch = -15 * (1 - p) * math.sin(math.pi * 0.5)
-            roll = 10 * (1 - p)
-        else:
-            pitch = 0
-            roll = 0
-
-        antenna_up = 0.5 * min(1.0, progress * 2)
-
-        pose = self._create_pose(roll=roll, pitch=pitch)
-        antennas = np.array([antenna_up, antenna_up])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _focus_start_kernel(progress)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _focus_reminder_pose(self, progress: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Gentle reminder during focus session."""
-        if progress < 0.5:
-            p = progress / 0.5
-            roll = 8 * math.sin(math.pi * p)
-            yaw = 5 * math.sin(math.pi * p)
-        else:
-            p = (progress - 0.5) / 0.5
-            roll = 8 * (1 - p)
-            yaw = 5 * (1 - p)
-
-        pose = self._create_pose(roll=roll, yaw=yaw)
-        antennas = np.array([0.2, 0.2])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, _, _ = _focus_reminder_kernel(progress)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, _ANTENNAS_UP, 0.0
 
     def _focus_complete_pose(self, progress: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Celebration when focus session completes."""
-        bounce = math.sin(math.pi * progress * 2) * (1 - progress)  # Slowed from 4
-        z = 15 * bounce
-        pitch = -10 * bounce
-
-        antenna_wave = 0.5 * math.sin(math.pi * progress * 3)  # Slowed from 6
-
-        pose = self._create_pose(pitch=pitch, z=z)
-        antennas = np.array([0.3 + antenna_wave, 0.3 - antenna_wave])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _focus_complete_kernel(progress)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _break_start_pose(self, progress: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Relaxed pose when break starts."""
-        if progress < 0.4:
-            p = progress / 0.4
-            pitch = -10 * p  
-            z = 10 * p
-        else:
-            p = (progress - 0.4) / 0.6
-            pitch = -10 + 15 * p  
-            z = 10 - 5 * p
-
-        antenna_pos = 0.4 * (1 - progress)
-
-        pose = self._create_pose(pitch=pitch, z=z)
-        antennas = np.array([antenna_pos, antenna_pos])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _break_start_kernel(progress)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _celebration_pose(self, elapsed: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Victory dance for completing tasks."""
-        bounce_freq = 1.0
-        sway_freq = 0.5
-
-        z = 15 * abs(math.sin(2 * math.pi * bounce_freq * elapsed))
-        yaw = 20 * math.sin(2 * math.pi * sway_freq * elapsed)
-        roll = 15 * math.sin(2 * math.pi * sway_freq * elapsed + math.pi / 4)
-
-        antenna_wave = 0.6 * math.sin(2 * math.pi * 0.8 * elapsed)  # Slowed from 4.0
-
-        pose = self._create_pose(roll=roll, yaw=yaw, z=z)
-        antennas = np.array([antenna_wave, -antenna_wave])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _celebration_kernel(elapsed)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _task_complete_pose(self, elapsed: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Happy animation when a task is completed."""
-        if elapsed < 1.0:
-            z = 20 * math.sin(math.pi * elapsed)
-            pitch = -15 * math.sin(math.pi * elapsed)
-            antenna_up = 0.7
-        else:
-            p = min(1.0, elapsed - 1.0)
-            z = 0
-            pitch = 0
-            antenna_up = 0.7 * (1 - p)
-
-        pose = self._create_pose(pitch=pitch, z=z)
-        antennas = np.array([antenna_up, antenna_up])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _task_complete_kernel(elapsed)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _nod_yes_pose(self, progress: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Nodding yes animation."""
-        nod_cycle = progress * 2
-        pitch = -12 * math.sin(math.pi * nod_cycle * 2)
-
-        pose = self._create_pose(pitch=pitch)
-        antennas = np.array([0.2, 0.2])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, _, _ = _nod_yes_kernel(progress)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, _ANTENNAS_UP, 0.0
 
     def _nod_no_pose(self, progress: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Shaking head no animation."""
-        shake_cycle = progress * 2
-        yaw = 15 * math.sin(math.pi * shake_cycle * 2)
-
-        pose = self._create_pose(yaw=yaw)
-        antennas = np.array([-0.2, -0.2])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, _, _ = _nod_no_kernel(progress)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, _ANTENNAS_DOWN, 0.0
 
     def _look_around_pose(self, elapsed: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Looking around curiously."""
-        yaw = 30 * math.sin(2 * math.pi * 0.3 * elapsed)
-        pitch = 10 * math.sin(2 * math.pi * 0.2 * elapsed + 0.5)
-
-        antenna_offset = 0.3 * math.sin(2 * math.pi * 0.4 * elapsed)
-
-        pose = self._create_pose(yaw=yaw, pitch=pitch)
-        antennas = np.array([0.3 + antenna_offset, 0.3 - antenna_offset])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _look_around_kernel(elapsed)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def _stretch_demo_pose(self, progress: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Demonstrate stretching (neck stretches)."""
-        cycle = progress * 4
-        if cycle < 1:
-            p = cycle
-            yaw = 25 * math.sin(math.pi * p)
-        elif cycle < 2:
-            p = cycle - 1
-            yaw = -25 * math.sin(math.pi * p)
-        elif cycle < 3:
-            p = cycle - 2
-            yaw = 0
-            pitch = -20 * math.sin(math.pi * p)
-        else:
-            p = cycle - 3
-            yaw = 0
-            pitch = 15 * math.sin(math.pi * p)
-
-        if cycle < 2:
-            pitch = 0
-
-        pose = self._create_pose(yaw=yaw, pitch=pitch)
-        antennas = np.array([0.2, 0.2])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, _, _ = _stretch_demo_kernel(progress)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, _ANTENNAS_UP, 0.0
 
     def _breathing_demo_pose(self, elapsed: float) -> Tuple[np.ndarray, np.ndarray, float]:
         """Demonstrate deep breathing exercise."""
-        cycle_duration = 12.0
-        cycle_pos = (elapsed % cycle_duration) / cycle_duration
-
-        if cycle_pos < 0.33:
-            p = cycle_pos / 0.33
-            z = 20 * p
-            pitch = -10 * p
-        elif cycle_pos < 0.66:
-            z = 20
-            pitch = -10
-        else:
-            p = (cycle_pos - 0.66) / 0.34
-            z = 20 * (1 - p)
-            pitch = -10 * (1 - p)
-
-        antenna_pos = 0.4 * (z / 20)
-
-        pose = self._create_pose(pitch=pitch, z=z)
-        antennas = np.array([antenna_pos, antenna_pos])
-        return pose, antennas, 0.0
+        roll, pitch, yaw, x, y, z, right, left = _breathing_demo_kernel(elapsed)
+        pose = self._create_pose(roll, pitch, yaw, x, y, z)
+        return pose, self._set_antennas(right, left), 0.0
 
     def get_current_movement_type(self) -> Optional[MovementType]:
         """Get the current movement type."""
         if self.current_movement:
             return self.current_movement.movement_type
         return None
+
+    # Pose function and whether it takes progress (True) or elapsed seconds
+    # (False), per movement type. Stored as plain functions and called with
+    # the manager, so update() does one lookup instead of an if/elif scan.
+    _POSE_DISPATCH: Dict[MovementType, Tuple[Callable[..., Tuple[np.ndarray, np.ndarray, float]], bool]] = {
+        MovementType.BREATHING: (_breathing_pose, False),
+        MovementType.TALKING: (_talking_pose, False),
+        MovementType.LISTENING: (_listening_pose, False),
+        MovementType.FOCUS_START: (_focus_start_pose, True),
+        MovementType.FOCUS_REMINDER: (_focus_reminder_pose, True),
+        MovementType.FOCUS_COMPLETE: (_focus_complete_pose, True),
+        MovementType.BREAK_START: (_break_start_pose, True),
+        MovementType.CELEBRATION: (_celebration_pose, False),
+        MovementType.TASK_COMPLETE: (_task_complete_pose, False),
+        MovementType.NOD_YES: (_nod_yes_pose, True),
+        MovementType.NOD_NO: (_nod_no_pose, True),
+        MovementType.LOOK_AROUND: (_look_around_pose, False),
+        MovementType.STRETCH_DEMO: (_stretch_demo_pose, True),
+        MovementType.BREATHING_DEMO: (_breathing_demo_pose, False),
+    }
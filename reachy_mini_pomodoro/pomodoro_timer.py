@@ -13,6 +13,10 @@ from reachy_mini_pomodoro.config import (
 )
 
 
+# "MM:SS" for every second up to 60:59, covering the longest (60 min) session
+_TIME_STRINGS = tuple(f"{m:02d}:{s:02d}" for m in range(61) for s in range(60))
+
+
 @dataclass
 class TimerEvent:
     """An event emitted by the timer."""
@@ -28,7 +32,8 @@ class PomodoroTimer:
         self.state = TimerState.IDLE
         self.previous_state = TimerState.IDLE  # For pause/resume
 
-        # Timer tracking
+        # Timer tracking (times are time.monotonic() seconds, so wall-clock
+        # adjustments don't stretch or cut short a session)
         self.time_remaining: int = 0  # Seconds remaining
         self.session_start_time: float = 0
         self.pause_time: float = 0
@@ -46,10 +51,23 @@ class PomodoroTimer:
         # Last reminder time (for focus reminders)
         self._last_reminder_time: float = 0
 
+        # Memoized get_status() payload, dropped whenever the timer changes
+        self._status_cache: Optional[dict] = None
+        self._status_version: int = 0
+        # Sub-dicts of the status payload that only change with settings or
+        # the break activity, so the per-second rebuild can share them
+        self._settings_dict = self._build_settings_dict()
+        self._activity_dict: Optional[dict] = None
+
     def add_event_listener(self, callback: Callable[[TimerEvent], None]) -> None:
         """Add a listener for timer events."""
         self._event_listeners.append(callback)
 
+    def _invalidate_status(self) -> None:
+        """Drop the memoized get_status() payload after a state change."""
+        self._status_version += 1
+        self._status_cache = None
+
     def _emit_event(self, event_type: str, data: Optional[dict] = None) -> None:
         """Emit an event to all listeners."""
         event = TimerEvent(event_type=event_type, data=data or {})
@@ -64,8 +82,10 @@ class PomodoroTimer:
         if self.state in (TimerState.IDLE, TimerState.SHORT_BREAK, TimerState.LONG_BREAK):
             self.state = TimerState.FOCUS
             self.time_remaining = self.settings.focus_duration
-            self.session_start_time = time.time()
-            self._last_reminder_time = time.time()
+            now = time.monotonic()
+            self.session_start_time = now
+            self._last_reminder_time = now
+            self._invalidate_status()
             self._emit_event("focus_started", {
                 "duration": self.settings.focus_duration,
                 "pomodoro_number": self.total_pomodoros + 1,
@@ -90,19 +110,16 @@ class PomodoroTimer:
                 self.time_remaining = self.settings.short_break_duration
                 break_type = "short"
 
-            self.session_start_time = time.time()
+            self.session_start_time = time.monotonic()
 
             # Select a random break activity
-            self.current_break_activity = random.choice(DEFAULT_BREAK_ACTIVITIES)
+            self._set_break_activity(random.choice(DEFAULT_BREAK_ACTIVITIES))
+            self._invalidate_status()
 
             self._emit_event("break_started", {
                 "break_type": break_type,
                 "duration": self.time_remaining,
-                "activity": {
-                    "name": self.current_break_activity.name,
-                    "description": self.current_break_activity.description,
-                    "robot_demo": self.current_break_activity.robot_demo,
-                } if self.current_break_activity else None,
+                "activity": self._activity_dict,
                 "pomodoros_completed": self.total_pomodoros,
             })
             return True
@@ -112,8 +129,9 @@ class PomodoroTimer:
         """Pause the timer."""
         if self.state in (TimerState.FOCUS, TimerState.SHORT_BREAK, TimerState.LONG_BREAK):
             self.previous_state = self.state
-            self.pause_time = time.time()
+            self.pause_time = time.monotonic()
             self.state = TimerState.PAUSED
+            self._invalidate_status()
             self._emit_event("timer_paused", {
                 "time_remaining": self.time_remaining,
                 "previous_state": self.previous_state.value,
@@ -125,9 +143,10 @@ class PomodoroTimer:
         """Resume the timer from pause."""
         if self.state == TimerState.PAUSED:
             # Adjust session start time to account for pause
-            pause_duration = time.time() - self.pause_time
+            pause_duration = time.monotonic() - self.pause_time
             self.session_start_time += pause_duration
             self.state = self.previous_state
+            self._invalidate_status()
             self._emit_event("timer_resumed", {
                 "state": self.state.value,
                 "time_remaining": self.time_remaining,
@@ -141,7 +160,8 @@ class PomodoroTimer:
             previous_state = self.state
             self.state = TimerState.IDLE
             self.time_remaining = 0
-            self.current_break_activity = None
+            self._set_break_activity(None)
+            self._invalidate_status()
             self._emit_event("timer_stopped", {
                 "previous_state": previous_state.value,
             })
@@ -157,6 +177,7 @@ class PomodoroTimer:
         elif self.state in (TimerState.SHORT_BREAK, TimerState.LONG_BREAK):
             # Skip break = start focus
             self.state = TimerState.IDLE
+            self._invalidate_status()
             self._emit_event("break_skipped", {})
             return self.start_focus()
         return False
@@ -167,15 +188,19 @@ class PomodoroTimer:
             return
 
         if self.state in (TimerState.FOCUS, TimerState.SHORT_BREAK, TimerState.LONG_BREAK):
-            elapsed = time.time() - self.session_start_time
+            now = time.monotonic()  # One clock read per update
+            elapsed = now - self.session_start_time
             duration = self._get_current_duration()
-            self.time_remaining = max(0, int(duration - elapsed))
+            remaining = max(0, int(duration - elapsed))
+            if remaining != self.time_remaining:
+                self.time_remaining = remaining
+                self._invalidate_status()
 
             # Check for focus reminders
             if self.state == TimerState.FOCUS:
-                time_since_reminder = time.time() - self._last_reminder_time
+                time_since_reminder = now - self._last_reminder_time
                 if time_since_reminder >= self.settings.focus_reminder_interval:
-                    self._last_reminder_time = time.time()
+                    self._last_reminder_time = now
                     self._emit_event("focus_reminder", {
                         "time_remaining": self.time_remaining,
                         "minutes_left": self.time_remaining // 60,
@@ -207,29 +232,33 @@ class PomodoroTimer:
                 "break_type": "long" if self.state == TimerState.LONG_BREAK else "short",
             })
             self.state = TimerState.IDLE
-            self.current_break_activity = None
+            self._set_break_activity(None)
+            self._invalidate_status()
 
     def get_status(self) -> dict:
-        """Get the current timer status."""
-        return {
+        """Get the current timer status.
+
+        The returned dict is shared between callers until the timer changes,
+        so treat it as read-only.
+        """
+        status = self._status_cache
+        if status is not None:
+            return status
+        version = self._status_version
+        status = {
             "state": self.state.value,
             "time_remaining": self.time_remaining,
             "time_remaining_formatted": self._format_time(self.time_remaining),
             "pomodoros_in_cycle": self.pomodoros_in_cycle,
             "total_pomodoros": self.total_pomodoros,
             "pomodoros_until_long_break": self.settings.pomodoros_until_long_break - self.pomodoros_in_cycle,
-            "current_break_activity": {
-                "name": self.current_break_activity.name,
-                "description": self.current_break_activity.description,
-                "robot_demo": self.current_break_activity.robot_demo,
-            } if self.current_break_activity else None,
-            "settings": {
-                "focus_duration": self.settings.focus_duration,
-                "short_break_duration": self.settings.short_break_duration,
-                "long_break_duration": self.settings.long_break_duration,
-                "pomodoros_until_long_break": self.settings.pomodoros_until_long_break,
-            }
+            "current_break_activity": self._activity_dict,
+            "settings": self._settings_dict,
         }
+        # Don't publish a payload built while another thread mutated the timer
+        if version == self._status_version:
+            self._status_cache = status
+        return status
 
     def update_settings(self, focus_duration: Optional[int] = None,
                         short_break_duration: Optional[int] = None,
@@ -244,10 +273,32 @@ class PomodoroTimer:
             self.settings.long_break_duration = max(60, min(long_break_duration, 60 * 60))  # 1-60 min
         if pomodoros_until_long_break is not None:
             self.settings.pomodoros_until_long_break = max(2, min(pomodoros_until_long_break, 10))
+        self._settings_dict = self._build_settings_dict()
+        self._invalidate_status()
+
+    def _build_settings_dict(self) -> dict:
+        """Build the "settings" part of the status payload."""
+        return {
+            "focus_duration": self.settings.focus_duration,
+            "short_break_duration": self.settings.short_break_duration,
+            "long_break_duration": self.settings.long_break_duration,
+            "pomodoros_until_long_break": self.settings.pomodoros_until_long_break,
+        }
+
+    def _set_break_activity(self, activity: Optional[BreakActivity]) -> None:
+        """Set the current break activity and its status/event dict."""
+        self.current_break_activity = activity
+        self._activity_dict = {
+            "name": activity.name,
+            "description": activity.description,
+            "robot_demo": activity.robot_demo,
+        } if activity else None
 
     @staticmethod
     def _format_time(seconds: int) -> str:
         """Format seconds as MM:SS."""
+        if 0 <= seconds < len(_TIME_STRINGS):
+            return _TIME_STRINGS[seconds]
         minutes = seconds // 60
         secs = seconds % 60
         return f"{minutes:02d}:{secs:02d}"
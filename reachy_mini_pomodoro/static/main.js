@@ -943,14 +943,52 @@ function setupEventListeners() {
     }
 }
 
-async function init() {
-    setupEventListeners();
-    await fetchStatus();
+// Status is pushed over a WebSocket; polling only runs while it is down
+let statusWs = null;
+
+function startStatusPolling() {
+    if (!updateInterval) {
+        updateInterval = setInterval(fetchStatus, 1000);
+    }
+}
 
+function stopStatusPolling() {
     if (updateInterval) {
         clearInterval(updateInterval);
+        updateInterval = null;
     }
-    updateInterval = setInterval(fetchStatus, 1000);
+}
+
+function connectStatusWebSocket() {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    statusWs = new WebSocket(`${protocol}//${window.location.host}/api/status/ws`);
+
+    statusWs.onopen = () => {
+        stopStatusPolling();
+    };
+
+    statusWs.onmessage = (event) => {
+        try {
+            appState = JSON.parse(event.data);
+            updateUI();
+        } catch (e) {
+            console.error('Invalid status message:', e);
+        }
+    };
+
+    statusWs.onclose = () => {
+        statusWs = null;
+        startStatusPolling();
+        setTimeout(connectStatusWebSocket, 3000);
+    };
+}
+
+async function init() {
+    setupEventListeners();
+    await fetchStatus();
+
+    startStatusPolling();
+    connectStatusWebSocket();
 
     initVoice();
 }
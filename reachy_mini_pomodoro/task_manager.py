@@ -1,10 +1,12 @@
 """Task management for the Pomodoro app."""
 
+import threading
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from reachy_mini_pomodoro.database import PomodoroDatabase, TaskRecord
 
@@ -96,7 +98,7 @@ class Task:
     @classmethod
     def from_db_record(cls, record: TaskRecord) -> "Task":
         """Create from database record."""
-        tags = [t.strip() for t in record.tags.split(",") if t.strip()]
+        tags = list(record.tags_list)
         return cls(
             id=record.id,
             title=record.title,
@@ -115,12 +117,24 @@ class Task:
 class TaskManager:
     """Manages the task list for the Pomodoro app."""
 
-    def __init__(self, use_database: bool = True) -> None:
+    def __init__(self, use_database: bool = True, defer_writes: bool = False) -> None:
         self.tasks: List[Task] = []
+        # Same tasks keyed by id; kept in step with self.tasks
+        self._by_id: Dict[str, Task] = {}
         self.current_task_id: Optional[str] = None
         self.total_pomodoros_today: int = 0
         self.session_start: datetime = datetime.now()
         self.tag_filter: Optional[str] = None  # Current tag filter
+        # Memoized to_dict() payload, dropped whenever tasks or stats change
+        self._dict_cache: Optional[dict] = None
+        self._dict_version: int = 0
+
+        # Database writes recorded by mutations, in order. With defer_writes the
+        # owner runs them via flush_writes() once it has released its own state
+        # lock, so disk I/O never happens while that lock is held
+        self.defer_writes = defer_writes
+        self._pending_writes: Deque[Tuple[Callable[..., Any], tuple]] = deque()
+        self._write_lock = threading.Lock()
 
         # Database for persistence
         self.db: Optional[PomodoroDatabase] = None
@@ -134,15 +148,38 @@ class TaskManager:
             return
         records = self.db.get_all_tasks(include_completed=True)
         self.tasks = [Task.from_db_record(r) for r in records]
+        self._by_id = {task.id: task for task in self.tasks}
 
         # Load today's stats
         stats = self.db.get_daily_stats()
         self.total_pomodoros_today = stats["total_pomodoros"]
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Drop the memoized to_dict() payload after a state change."""
+        self._dict_version += 1
+        self._dict_cache = None
+
+    def _queue_write(self, func: Callable[..., Any], *args: Any) -> None:
+        """Record a database write, running it now unless writes are deferred."""
+        self._pending_writes.append((func, args))
+        if not self.defer_writes:
+            self.flush_writes()
+
+    def flush_writes(self) -> None:
+        """Run the recorded database writes in the order they were made."""
+        with self._write_lock:
+            pending = self._pending_writes
+            while pending:
+                func, args = pending.popleft()
+                func(*args)
 
     def _save_task_to_db(self, task: Task) -> None:
         """Save a task to the database."""
+        self._invalidate_cache()
         if self.db:
-            self.db.save_task(task.to_db_record())
+            # Snapshot the task now; the write may run after later mutations
+            self._queue_write(self.db.save_task, task.to_db_record())
 
     def add_task(self, title: str, estimated_pomodoros: int = 1,
                  notes: str = "", tags: Optional[List[str]] = None,
@@ -161,20 +198,18 @@ class TaskManager:
             due_date=parsed_due_date,
         )
         self.tasks.insert(0, task)
+        self._by_id[task.id] = task
         self._save_task_to_db(task)
 
         if self.db and tags:
             for tag in tags:
-                self.db.save_tag(tag)
+                self._queue_write(self.db.save_tag, tag)
 
         return task
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
 
     def get_current_task(self) -> Optional[Task]:
         """Get the currently active task."""
@@ -223,12 +258,13 @@ class TaskManager:
             self._save_task_to_db(task)
 
             if self.db:
-                self.db.increment_tasks_completed()
+                self._queue_write(self.db.increment_tasks_completed)
 
             if self.current_task_id == task_id:
                 self.current_task_id = None
                 # Auto-select next pending task
                 self._select_next_task()
+                self._invalidate_cache()
             return task
         return None
 
@@ -243,26 +279,27 @@ class TaskManager:
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task by ID."""
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                if self.current_task_id == task_id:
-                    self.current_task_id = None
-                self.tasks.pop(i)
-                if self.db:
-                    self.db.delete_task(task_id)
-                return True
-        return False
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            return False
+        if self.current_task_id == task_id:
+            self.current_task_id = None
+        self.tasks = [t for t in self.tasks if t is not task]
+        self._invalidate_cache()
+        if self.db:
+            self._queue_write(self.db.delete_task, task_id)
+        return True
 
     def reorder_tasks(self, task_ids: List[str]) -> bool:
         """Reorder tasks based on the provided list of IDs."""
         # Validate all IDs exist
-        existing_ids = {task.id for task in self.tasks}
-        if set(task_ids) != existing_ids:
+        by_id = self._by_id
+        if set(task_ids) != by_id.keys():
             return False
 
         # Create new ordered list
-        task_map = {task.id: task for task in self.tasks}
-        self.tasks = [task_map[tid] for tid in task_ids]
+        self.tasks = [by_id[tid] for tid in task_ids]
+        self._invalidate_cache()
         return True
 
     def update_task(self, task_id: str, title: Optional[str] = None,
@@ -284,7 +321,7 @@ class TaskManager:
                 task.tags = tags
                 if self.db:
                     for tag in tags:
-                        self.db.save_tag(tag)
+                        self._queue_write(self.db.save_tag, tag)
             if priority is not None:
                 task.priority = TaskPriority(priority)
             if due_date is not None:
@@ -296,6 +333,7 @@ class TaskManager:
     def set_tag_filter(self, tag: Optional[str]) -> None:
         """Set a tag filter for task listing."""
         self.tag_filter = tag.lower().strip() if tag else None
+        self._invalidate_cache()
 
     def get_filtered_tasks(self) -> List[Task]:
         """Get tasks filtered by current tag filter."""
@@ -329,7 +367,17 @@ class TaskManager:
         return [{"name": tag, "color": "#3498db"} for tag in sorted(tags)]
 
     def get_stats(self) -> dict:
-        """Get productivity statistics."""
+        """Get productivity statistics.
+
+        Served from the memoized to_dict() payload when it is current, so
+        treat the returned dict as read-only.
+        """
+        cached = self._dict_cache
+        if cached is not None:
+            return cached["stats"]
+        return self._compute_stats()
+
+    def _compute_stats(self) -> dict:
         completed = self.get_completed_tasks()
         pending = self.get_pending_tasks()
         current = self.get_current_task()
@@ -362,20 +410,33 @@ class TaskManager:
         }
 
     def to_dict(self) -> dict:
-        """Convert entire task manager state to dictionary."""
-        filtered_tasks = self.get_filtered_tasks()
-        return {
-            "tasks": [t.to_dict() for t in filtered_tasks],
-            "current_task_id": self.current_task_id,
-            "stats": self.get_stats(),
-            "tags": self.get_all_tags(),
-        }
+        """Convert entire task manager state to dictionary.
+
+        Everything except "tags" is memoized until the next mutation and
+        shared between callers, so treat the nested values as read-only.
+        """
+        cached = self._dict_cache
+        if cached is None:
+            version = self._dict_version
+            cached = {
+                "tasks": [t.to_dict() for t in self.get_filtered_tasks()],
+                "current_task_id": self.current_task_id,
+                "stats": self._compute_stats(),
+            }
+            # Don't publish a payload built while another thread mutated state
+            if version == self._dict_version:
+                self._dict_cache = cached
+        # Tags can be created outside the task manager; the db caches them itself
+        return {**cached, "tags": self.get_all_tags()}
 
     def clear_completed(self) -> int:
         """Remove all completed tasks. Returns count of removed tasks."""
         initial_count = len(self.tasks)
         completed_ids = [t.id for t in self.tasks if t.status == TaskStatus.COMPLETED]
         self.tasks = [t for t in self.tasks if t.status != TaskStatus.COMPLETED]
+        for task_id in completed_ids:
+            self._by_id.pop(task_id, None)
+        self._invalidate_cache()
 
         # Note: We don't delete from DB to keep history
         return initial_count - len(self.tasks)
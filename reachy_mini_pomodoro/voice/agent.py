@@ -70,6 +70,7 @@ class CompitaVoiceAgent:
         on_audio_output: Optional[Callable[[bytes], None]] = None,
         on_transcript: Optional[Callable[[str, str], None]] = None,
         head_wobbler: Optional["HeadWobbler"] = None,
+        state_call: Optional[Callable[..., Any]] = None,
     ) -> None:
         """Initialize Compita voice agent.
 
@@ -84,6 +85,8 @@ class CompitaVoiceAgent:
             on_audio_output: Callback for audio output (PCM16 bytes at 24kHz).
             on_transcript: Callback for transcripts (role, text).
             head_wobbler: Optional head wobbler for audio-driven head movements.
+            state_call: Optional callable the tools run timer/task mutations
+                through, as state_call(func, *args, **kwargs).
         """
         self.timer = timer
         self.task_manager = task_manager
@@ -99,7 +102,9 @@ class CompitaVoiceAgent:
         self.model = model
         self.voice = voice
         self.system_instructions = system_instructions or DEFAULT_COMPITA_INSTRUCTIONS
-        self.tool_handler = PomodoroToolHandler(timer, task_manager, movement_manager)
+        self.tool_handler = PomodoroToolHandler(
+            timer, task_manager, movement_manager, state_call=state_call
+        )
 
         self.on_audio_output = on_audio_output
         self.on_transcript = on_transcript
@@ -474,6 +479,7 @@ class CompitaVoiceSession:
         on_audio_output: Optional[Callable[[bytes], None]] = None,
         on_transcript: Optional[Callable[[str, str], None]] = None,
         on_state_change: Optional[Callable[[SessionState], None]] = None,
+        state_call: Optional[Callable[..., Any]] = None,
     ) -> None:
         """Initialize voice session.
 
@@ -488,6 +494,8 @@ class CompitaVoiceSession:
             on_audio_output: Callback for audio output (PCM16 bytes at 24kHz).
             on_transcript: Callback for transcripts (role, text).
             on_state_change: Callback when session state changes.
+            state_call: Optional callable the tools run timer/task mutations
+                through, as state_call(func, *args, **kwargs).
         """
         self.timer = timer
         self.task_manager = task_manager
@@ -500,6 +508,7 @@ class CompitaVoiceSession:
         self.on_audio_output = on_audio_output
         self.on_transcript = on_transcript
         self.on_state_change = on_state_change
+        self.state_call = state_call
 
         self._state = SessionState.LISTENING
         self._agent: Optional[CompitaVoiceAgent] = None
@@ -590,6 +599,7 @@ class CompitaVoiceSession:
             on_audio_output=self._handle_audio_output,
             on_transcript=self._handle_transcript,
             head_wobbler=self._head_wobbler,
+            state_call=self.state_call,
         )
 
         buffered_audio = b"".join(self._audio_buffer)
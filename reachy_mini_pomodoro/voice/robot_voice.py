@@ -9,7 +9,7 @@ import logging
 import os
 import threading
 import time
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import numpy as np
 from scipy.signal import resample
@@ -45,6 +45,7 @@ class RobotVoiceLoop:
         movement_manager: Optional["MovementManager"] = None,
         openai_api_key: Optional[str] = None,
         voice: str = "coral",
+        state_call: Optional[Callable[..., Any]] = None,
     ) -> None:
         """Initialize robot voice loop.
 
@@ -55,6 +56,8 @@ class RobotVoiceLoop:
             movement_manager: Optional movement manager for animations.
             openai_api_key: OpenAI API key.
             voice: Voice to use for responses.
+            state_call: Optional callable the tools run timer/task mutations
+                through, as state_call(func, *args, **kwargs).
         """
         self._robot = robot
         self._timer = timer
@@ -62,6 +65,7 @@ class RobotVoiceLoop:
         self._movement_manager = movement_manager
         self._api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self._voice = voice
+        self._state_call = state_call
 
         self._running = False
         self._thread: Optional[threading.Thread] = None
@@ -131,6 +135,7 @@ class RobotVoiceLoop:
             on_audio_output=self._handle_audio_output,
             on_transcript=self._handle_transcript,
             on_state_change=self._handle_state_change,
+            state_call=self._state_call,
         )
         self._session.start()
         logger.info("Compita voice session started")
@@ -4,8 +4,9 @@ These tools allow the LLM to interact with the Pomodoro app
 to control the timer, manage tasks, and retrieve status.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
     from reachy_mini_pomodoro.movements import MovementManager
@@ -14,6 +15,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def get_pomodoro_tools() -> List[Dict[str, Any]]:
     """Get tool specifications for OpenAI Realtime API."""
@@ -125,10 +128,22 @@ class PomodoroToolHandler:
         timer: "PomodoroTimer",
         task_manager: "TaskManager",
         movement_manager: Optional["MovementManager"] = None,
+        state_call: Optional[Callable[..., Any]] = None,
     ) -> None:
         self.timer = timer
         self.task_manager = task_manager
         self.movement_manager = movement_manager
+        # Runs timer/task mutations for the app: state_call(func, *args, **kwargs)
+        # serializes func with the app's own state changes and blocks
+        self.state_call = state_call
+
+    async def _mutate(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a timer/task mutation through state_call, off the voice event loop."""
+        if self.state_call is None:
+            result = func(*args, **kwargs)
+            self.task_manager.flush_writes()
+            return result
+        return await asyncio.to_thread(self.state_call, func, *args, **kwargs)
 
     async def dispatch(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool by name and return the result."""
@@ -170,12 +185,14 @@ class PomodoroToolHandler:
 
     async def _handle_start_focus(self) -> Dict[str, Any]:
         """Start a focus session."""
-        if not self.task_manager.get_current_task():
-            pending = self.task_manager.get_pending_tasks()
-            if pending:
-                self.task_manager.set_current_task(pending[0].id)
-
-        success = self.timer.start_focus()
+        def start_focus() -> bool:
+            if not self.task_manager.get_current_task():
+                pending = self.task_manager.get_pending_tasks()
+                if pending:
+                    self.task_manager.set_current_task(pending[0].id)
+            return self.timer.start_focus()
+
+        success = await self._mutate(start_focus)
         task = self.task_manager.get_current_task()
 
         return {
@@ -186,7 +203,7 @@ class PomodoroToolHandler:
 
     async def _handle_pause_timer(self) -> Dict[str, Any]:
         """Pause the timer."""
-        success = self.timer.pause()
+        success = await self._mutate(self.timer.pause)
         return {
             "success": success,
             "message": "Timer paused" if success else "Could not pause timer",
@@ -194,7 +211,7 @@ class PomodoroToolHandler:
 
     async def _handle_resume_timer(self) -> Dict[str, Any]:
         """Resume the timer."""
-        success = self.timer.resume()
+        success = await self._mutate(self.timer.resume)
         return {
             "success": success,
             "message": "Timer resumed" if success else "Could not resume timer",
@@ -202,7 +219,7 @@ class PomodoroToolHandler:
 
     async def _handle_stop_timer(self) -> Dict[str, Any]:
         """Stop the timer."""
-        success = self.timer.stop()
+        success = await self._mutate(self.timer.stop)
         return {
             "success": success,
             "message": "Timer stopped" if success else "Could not stop timer",
@@ -213,7 +230,7 @@ class PomodoroToolHandler:
         status = self.timer.get_status()
         state = status.get("state", "idle")
 
-        success = self.timer.skip()
+        success = await self._mutate(self.timer.skip)
         if success:
             if state == "focus":
                 return {
@@ -237,7 +254,7 @@ class PomodoroToolHandler:
 
     async def _handle_start_break(self) -> Dict[str, Any]:
         """Start a break session."""
-        success = self.timer.start_break()
+        success = await self._mutate(self.timer.start_break)
         status = self.timer.get_status()
         break_type = "long" if status["state"] == "long_break" else "short"
 
@@ -275,7 +292,8 @@ class PomodoroToolHandler:
         priority: str = "medium",
     ) -> Dict[str, Any]:
         """Create a new task."""
-        task = self.task_manager.add_task(
+        task = await self._mutate(
+            self.task_manager.add_task,
             title=title,
             estimated_pomodoros=estimated_pomodoros,
             priority=priority,
@@ -292,7 +310,7 @@ class PomodoroToolHandler:
         if not current:
             return {"success": False, "message": "No current task to complete"}
 
-        task = self.task_manager.complete_task(current.id)
+        task = await self._mutate(self.task_manager.complete_task, current.id)
         if task:
             if self.movement_manager:
                 from reachy_mini_pomodoro.movements import MovementType